@@ -3,10 +3,14 @@
 
 import os
 import re
-import csv
 import logging
-from flask import Flask, render_template, request
-from jinja2 import ChoiceLoader, FileSystemLoader
+import tempfile
+import threading
+from itertools import chain
+from urllib.parse import quote
+from werkzeug.wsgi import wrap_file
+from flask import Flask, Request, render_template, request
+from jinja2 import FileSystemLoader, FileSystemBytecodeCache
 from flask_login import login_required, current_user
 
 # --- CORE EXTENSIONS ---
@@ -14,10 +18,13 @@ from extensions import db, migrate, login_manager
 
 # --- BLUEPRINTS ---
 from modules.auth import auth_bp
-from modules.audit_slide.routes import audit_bp 
+from modules.audit_slide.routes import audit_bp, recover_interrupted_audits, purge_trash
 
 # --- SERVICES ---
 from services.logger_service import LoggerService
+from services.project_index import ProjectIndex
+from services import fastjson
+from services.view_cache import cache, current_view_key, has_pending_flashes, VIEW_CACHE_CONFIG, VIEW_CACHE_TIMEOUT
 import models
 
 # --- CONFIGURATION ---
@@ -26,29 +33,82 @@ UPLOAD_FOLDER = os.path.join('data', 'uploads')
 OUTPUT_FOLDER = os.path.join('data', 'reports')
 LOG_FOLDER = os.path.join('data', 'logs')
 CONFIG_DIR = os.path.join('data', 'config')
+JINJA_CACHE_DIR = os.path.join('data', '.jinja_cache')
+REMEDIATED_FOLDER = os.path.join(OUTPUT_FOLDER, 'remediated_decks')
 
-# Ensure critical directories exist
-for folder in [UPLOAD_FOLDER, OUTPUT_FOLDER, LOG_FOLDER, CONFIG_DIR]: 
+SYSTEM_LOG_PATH = os.path.join(LOG_FOLDER, 'platform_system.log')
+TOKEN_LEDGER_PATH = os.path.join(LOG_FOLDER, 'token_ledger.csv')
+LEDGER_STATE_PATH = os.path.join(LOG_FOLDER, 'token_ledger.state.json')
+# Bumped when row parsing changes, so totals counted by an older parser are recounted once
+LEDGER_STATE_VERSION = 2
+
+# System log line: "<asctime> - <LEVEL> - [IP: <ip> - ]<message>" (see LoggerService.log_system)
+# Multiline so one findall() pass parses a whole tail buffer. Anchored, and the dashboard's
+# time-of-day is captured directly (no per-entry split)
+LOG_LINE_RE = re.compile(r"^\d{4}-\d{2}-\d{2} (\d{2}:\d{2}:\d{2}),\d+ - (\w+) - (?:IP: (\S+) - )?(.*)$", re.M)
+LOG_TAIL_LINES = 100
+
+# Token ledger row (AIEngine.log_usage, csv.writer):
+#     Timestamp,Agent,Provider,Model,Input_Tokens,Output_Tokens,Latency_Sec,Status
+# Matched from the row start, field by field with CSV quoting ("..." with "" escapes), so a
+# quoted comma in any text column (e.g. an error Status) can't shift or drop the row, as with
+# csv.reader. The header never matches (non-numeric token columns).
+_CSV_FIELD = rb'(?:"(?:[^"]|"")*"|[^,"\r\n]*)'
+LEDGER_ROW_RE = re.compile(
+    rb"^" + (_CSV_FIELD + rb",") * 4 + rb"(\d+),(\d+)," + _CSV_FIELD + rb"," + _CSV_FIELD + rb"\r?$", re.M
+)
+# Running token total of the append-only ledger: only rows added since the last read are parsed.
+# Checkpointed to LEDGER_STATE_PATH so a restart (or another worker) resumes instead of re-reading it all.
+_ledger_state = None
+_ledger_lock = threading.Lock()
+
+# Ensure critical directories exist (once, at startup - routes assume they do)
+for folder in [UPLOAD_FOLDER, OUTPUT_FOLDER, LOG_FOLDER, CONFIG_DIR, REMEDIATED_FOLDER, JINJA_CACHE_DIR]: 
     os.makedirs(folder, exist_ok=True)
 
+class UploadRequest(Request):
+    """
+    Spools multipart file parts straight into the uploads folder (instead of a temp
+    file elsewhere), so save_upload can link the finished file into place with no second copy.
+    """
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return tempfile.NamedTemporaryFile('wb+', dir=UPLOAD_FOLDER, prefix='.incoming-')
+
 app = Flask(__name__)
+app.request_class = UploadRequest
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-key-change-in-prod')
 
 # --- TEMPLATE CONFIGURATION ---
 # Allows templates to be loaded from both the platform shell and specific modules
 platform_template_dir = os.path.join(BASE_DIR, 'platform_shell', 'templates')
 module_template_dir = os.path.join(BASE_DIR, 'modules', 'audit_slide', 'templates')
-app.jinja_loader = ChoiceLoader([
-    FileSystemLoader(platform_template_dir), 
-    FileSystemLoader(module_template_dir)
-])
+# One loader with a search path (platform shell first) instead of a ChoiceLoader of two
+app.jinja_loader = FileSystemLoader([platform_template_dir, module_template_dir])
+# Compiled templates persist across restarts/workers; recompiled only when the source changes
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_DIR)
+# Outside development, templates only change on deploy: skip the per-render mtime check
+if os.getenv('FLASK_DEBUG') != '1':
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.auto_reload = False
 
 app.config.update(
     UPLOAD_FOLDER=UPLOAD_FOLDER, 
     OUTPUT_FOLDER=OUTPUT_FOLDER, 
-    MAX_CONTENT_LENGTH=500 * 1024 * 1024  # 500MB Limit
+    MAX_CONTENT_LENGTH=500 * 1024 * 1024,  # 500MB Limit
+    MAX_FORM_MEMORY_SIZE=1024 * 1024       # Non-file form fields only; file parts spool to disk
 )
 
+# Behind nginx/Apache, let the web server stream report/deck files (X-Sendfile)
+app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE', '0') == '1'
+
+# nginx speaks X-Accel-Redirect instead. Set X_ACCEL_PREFIX to an internal location
+# that aliases the data folder, e.g.
+#     location /internal/data/ { internal; alias /app/data/; }
+X_ACCEL_PREFIX = os.getenv('X_ACCEL_PREFIX')
+DATA_ROOT = os.path.abspath('data')
+if X_ACCEL_PREFIX:
+    app.config['USE_X_SENDFILE'] = True
+
 # --- DATABASE CONFIGURATION ---
 # Connects to PostgreSQL (Docker or Prod)
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'postgresql://audit_user:secure_pass_123@db:5432/audit_db')
@@ -59,9 +119,14 @@ db.init_app(app)
 migrate.init_app(app, db)
 login_manager.init_app(app)
 login_manager.login_view = 'auth.login' # Automatic redirect for protected routes
+cache.init_app(app, config=VIEW_CACHE_CONFIG)
+
+# Initialize System Logger (retention cleanup runs in run_startup_tasks)
+logger_service = LoggerService(base_data_path='data', run_cleanup=False)
 
-# Initialize System Logger
-logger_service = LoggerService(base_data_path='data')
+# Initialize Report Manifest (shared with blueprints via app.extensions)
+project_index = ProjectIndex(base_data_path='data')
+app.extensions['project_index'] = project_index
 
 # --- REGISTER BLUEPRINTS ---
 # 1. Authentication (Login/Register)
@@ -69,54 +134,164 @@ app.register_blueprint(auth_bp)
 
 # 2. Tools (AuditSlide AI)
 app.register_blueprint(audit_bp)
+# The AI/Fix engines are built per worker (gunicorn post_fork), or lazily on first use
+
+# --- ONE-TIME STARTUP ---
+def run_startup_tasks():
+    """
+    Startup work that must run once per server start, never at import: spawned audit workers
+    (ProcessPoolExecutor) re-import this module, and must not fail the jobs they are running.
+    Called from gunicorn's when_ready hook (master, before workers fork) or `python app.py`.
+    """
+    # Any cold report scan happens here, not in a request
+    project_index.warm()
+    # Enforce the 7-day retention of per-report logs
+    logger_service.cleanup_user_logs(retention_days=7)
+    # Jobs queued/running when the last process stopped will never finish: report them as failed
+    recover_interrupted_audits(OUTPUT_FOLDER)
+    # Report folders of deleted groups whose background removal was cut short
+    purge_trash(OUTPUT_FOLDER)
+
+# --- FILE OFFLOAD (nginx) ---
+def _file_slice(path, start, stop, block=64 * 1024):
+    """Streams bytes [start, stop) of a file."""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = stop - start
+        while remaining > 0:
+            chunk = f.read(min(block, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+@app.after_request
+def x_accel_redirect(response):
+    """Rewrites Flask's X-Sendfile header for files under data/ into an nginx X-Accel-Redirect."""
+    sendfile_path = response.headers.get('X-Sendfile')
+    if not (X_ACCEL_PREFIX and sendfile_path):
+        return response
+
+    del response.headers['X-Sendfile']
+    # 304 Not Modified / 416 Range Not Satisfiable: no body to send
+    if response.status_code not in (200, 206):
+        return response
+    rel_path = os.path.relpath(sendfile_path, DATA_ROOT)
+    # nginx drops Content-Encoding on internal redirects (pre-gzipped reports), and can only
+    # serve what its location aliases: stream those bodies from Flask as before
+    if 'Content-Encoding' in response.headers or rel_path.startswith('..'):
+        if response.status_code == 206:
+            # Range already validated by make_conditional: send just that slice
+            content_range = response.content_range
+            response.response = _file_slice(sendfile_path, content_range.start, content_range.stop)
+        else:
+            response.response = wrap_file(request.environ, open(sendfile_path, 'rb'))
+        response.direct_passthrough = True
+        return response
+
+    if response.status_code == 206:
+        # nginx applies the client's Range header to the internal redirect itself
+        response.status_code = 200
+        del response.headers['Content-Range']
+        response.headers.pop('Content-Length', None)
+    response.headers['X-Accel-Redirect'] = f"{X_ACCEL_PREFIX.rstrip('/')}/{quote(rel_path.replace(os.sep, '/'))}"
+    return response
 
 # --- USER SESSION LOADER ---
 @login_manager.user_loader
 def load_user(user_id):
     return models.User.query.get(int(user_id))
 
+# --- LOG TAIL ---
+def tail_lines(path, n, block=8192):
+    """Returns the last `n` lines of a file as bytes, reading backwards in `block`-sized chunks."""
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b''
+        # n + 1 newlines: the first line of the buffer may be partial
+        while pos > 0 and data.count(b'\n') <= n:
+            read = min(block, pos)
+            pos -= read
+            f.seek(pos)
+            data = f.read(read) + data
+    return b'\n'.join(data.splitlines()[-n:])
+
+# --- TOKEN LEDGER ---
+def _load_ledger_state():
+    """Last saved checkpoint {'offset', 'total', 'inode'}, or a fresh one."""
+    try:
+        state = fastjson.load(LEDGER_STATE_PATH)
+        if state.get('version') != LEDGER_STATE_VERSION:
+            raise ValueError('checkpoint from an older ledger parser')
+        return {'offset': int(state['offset']), 'total': int(state['total']), 'inode': state.get('inode')}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {'offset': 0, 'total': 0, 'inode': None}
+
+def _save_ledger_state(state):
+    tmp_path = f"{LEDGER_STATE_PATH}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(fastjson.dumps({**state, 'version': LEDGER_STATE_VERSION}))
+        os.replace(tmp_path, LEDGER_STATE_PATH)
+    except OSError:
+        pass  # only a checkpoint: the next call just parses a little more
+
+def ledger_token_total():
+    """
+    Input + output tokens across token_ledger.csv. Rows are appended by AIEngine.log_usage,
+    so each call seeks to the last parsed offset and sums only complete new lines.
+    """
+    global _ledger_state
+    with _ledger_lock:
+        try:
+            st = os.stat(TOKEN_LEDGER_PATH)
+        except OSError:
+            return 0
+        size = st.st_size
+        if _ledger_state is None:
+            _ledger_state = _load_ledger_state()
+        # Ledger replaced or truncated: start over
+        if _ledger_state['inode'] != st.st_ino or size < _ledger_state['offset']:
+            _ledger_state = {'offset': 0, 'total': 0, 'inode': st.st_ino}
+        if size == _ledger_state['offset']:
+            return _ledger_state['total']
+
+        with open(TOKEN_LEDGER_PATH, 'rb') as f:
+            f.seek(_ledger_state['offset'])
+            chunk = f.read(size - _ledger_state['offset'])
+        # A row still being written has no newline yet; leave it for the next call
+        end = chunk.rfind(b'\n') + 1
+        # One regex pass over the new rows, summed in C (no per-row Python loop)
+        token_counts = chain.from_iterable(LEDGER_ROW_RE.findall(chunk, 0, end))
+        total = _ledger_state['total'] + sum(map(int, token_counts))
+        if end:
+            _ledger_state.update(offset=_ledger_state['offset'] + end, total=total)
+            _save_ledger_state(_ledger_state)
+        return total
+
 # --- MASTER DASHBOARD ROUTE ---
+@app.before_request
+def log_dashboard_access():
+    """Logged outside the view so cached dashboard hits are still recorded."""
+    if request.endpoint == 'index':
+        logger_service.log_system('info', 'Admin dashboard accessed', ip=request.remote_addr)
+
 @app.route('/')
 @login_required
+@cache.cached(timeout=VIEW_CACHE_TIMEOUT, key_prefix=current_view_key, unless=has_pending_flashes)
 def index():
     """
     The main landing page for logged-in users.
     Aggregates high-level metrics from all tools.
+    Cached per user for a few seconds; any project mutation drops every cached page.
     """
-    logger_service.log_system('info', 'Admin dashboard accessed', ip=request.remote_addr)
-    
     # KPI Logic
-    total_audits = 0
-    all_scores = []
+    # Note: In future, replace manifest with: total_audits = models.Project.query.count()
+    # Derived from the shared report listing; only recomputed when the manifest changes
+    total_audits, avg_score = project_index.score_stats()
     
-    # Note: In future, replace file scan with: total_audits = models.Project.query.count()
-    if os.path.exists(OUTPUT_FOLDER):
-        for item in os.listdir(OUTPUT_FOLDER):
-            if os.path.isdir(os.path.join(OUTPUT_FOLDER, item)):
-                json_path = os.path.join(OUTPUT_FOLDER, item, 'audit_report.json')
-                if os.path.exists(json_path):
-                    total_audits += 1
-                    try:
-                        # Extract score for average calculation
-                        import json
-                        with open(json_path, 'r') as f: 
-                            data = json.load(f)
-                            score = data.get('summary', {}).get('executive_metrics', {}).get('wcag_compliance_rate', 0)
-                            all_scores.append(score)
-                    except: pass
-
-    avg_score = round(sum(all_scores) / len(all_scores), 1) if all_scores else 0
-    
-    # Token Usage Calculation
-    total_tokens = 0
-    token_ledger_path = os.path.join(LOG_FOLDER, 'token_ledger.csv')
-    if os.path.exists(token_ledger_path):
-        try:
-            with open(token_ledger_path, 'r') as f:
-                reader = csv.reader(f); next(reader, None)
-                for row in reader: 
-                    if len(row) >= 6: total_tokens += int(row[4]) + int(row[5])
-        except: pass
+    # Token Usage Calculation (incremental - see ledger_token_total)
+    total_tokens = ledger_token_total()
 
     kpi_data = {
         'total_audits': total_audits, 
@@ -127,21 +302,30 @@ def index():
     
     # System Log Tail
     system_logs = []
-    log_path = os.path.join(LOG_FOLDER, 'platform_system.log')
-    if os.path.exists(log_path):
-        try:
-            with open(log_path, 'r') as f: lines = f.readlines()[-10:] 
-            for line in reversed(lines):
-                match = re.search(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*? - (\w+) - (.*)", line)
-                if match:
-                    system_logs.append({
-                        'timestamp': match.group(1).split(' ')[1], 
-                        'level': match.group(2), 
-                        'message': match.group(3).strip()
-                    })
-        except: pass
+    try:
+        # Only the last lines are read (backwards from the end). If long entries
+        # (tracebacks) leave fewer than 10 log lines, widen the tail once.
+        for n_lines in (LOG_TAIL_LINES, LOG_TAIL_LINES * 10):
+            tail = tail_lines(SYSTEM_LOG_PATH, n_lines)
+            # One scan over the buffer instead of a split + match per line
+            matches = LOG_LINE_RE.findall(tail.decode('utf-8', 'replace'))
+            if len(matches) >= 10 or tail.count(b'\n') < n_lines - 1: break
+        for match in reversed(matches[-10:]):
+            timestamp, level, ip, message = match
+            system_logs.append({
+                'timestamp': timestamp, 
+                'level': level, 
+                'ip': ip,
+                'message': message.strip()
+            })
+    except: pass
 
     return render_template('dashboard.html', active_page='dashboard', kpis=kpi_data, system_logs=system_logs)
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Local development only - production runs wsgi:app under gunicorn (see Dockerfile)
+    debug = os.getenv('FLASK_DEBUG') == '1'
+    # With the reloader, only the serving child process (WERKZEUG_RUN_MAIN) runs startup work
+    if not debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        run_startup_tasks()
+    app.run(host='0.0.0.0', port=5000, debug=debug)
@@ -0,0 +1,30 @@
+# /gunicorn.conf.py - PRODUCTION SERVER CONFIG
+# Usage: gunicorn -c gunicorn.conf.py wsgi:app
+
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+
+# One worker per core; each serves requests on a small thread pool
+workers = int(os.getenv('WEB_CONCURRENCY', os.cpu_count() or 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+
+# Import the app once in the master: templates and the Jinja bytecode cache are then
+# shared copy-on-write by every forked worker
+preload_app = True
+
+# Audits run on background pools, so requests stay short; this only bounds stuck requests
+timeout = 120
+
+
+def when_ready(server):
+    """Once per server start, in the master, before any worker is forked."""
+    from app import run_startup_tasks
+    run_startup_tasks()
+
+
+def post_fork(server, worker):
+    """Builds this worker's own AI/Fix engines (API clients are not fork-safe, so not in the master)."""
+    from modules.audit_slide.routes import warm_engines
+    warm_engines()
@@ -2,6 +2,7 @@
 
 import os
 import json
+import orjson
 import re
 import time
 import logging
@@ -111,11 +112,11 @@ class AIEngine:
         
         llm_cfg = {}
         if os.path.exists(llm_cfg_path):
-            with open(llm_cfg_path, 'r') as f: llm_cfg = json.load(f)
+            with open(llm_cfg_path, 'rb') as f: llm_cfg = orjson.loads(f.read())
         
         brand_cfg = {}
         if os.path.exists(brand_cfg_path):
-            with open(brand_cfg_path, 'r') as f: brand_cfg = json.load(f)
+            with open(brand_cfg_path, 'rb') as f: brand_cfg = orjson.loads(f.read())
             
         return llm_cfg, brand_cfg
     
@@ -3,8 +3,9 @@
 import re
 import os
 import csv
-import json
+import orjson
 import importlib
+from operator import attrgetter
 from datetime import datetime
 from spellchecker import SpellChecker
 from pptx import Presentation
@@ -90,8 +91,8 @@ class PptxAnalyzer:
         config_loaded = False
         if os.path.exists(json_config_path):
             try:
-                with open(json_config_path, 'r') as f:
-                    user_config = json.load(f)
+                with open(json_config_path, 'rb') as f:
+                    user_config = orjson.loads(f.read())
                     
                     # Load Buffer
                     if 'default_buffer' in user_config and str(user_config['default_buffer']).strip():
@@ -498,7 +499,7 @@ class PptxAnalyzer:
         if not title_candidates:
             slide_issues.append({"slide": slide_index, "check": "Accessibility Reading Order", "shape_name": "Slide", "result": "FAIL", "details": "Slide missing standard Title placeholder."})
             return
-        title_candidates.sort(key=lambda s: s.top); target_title = title_candidates[0] 
+        target_title = min(title_candidates, key=attrgetter('top'))  # topmost title; no full sort needed
         for s in slide.shapes:
             if shapes_overlap(target_title, s) and not self._is_exempt_shape(s) and s.shape_id != target_title.shape_id:
                 slide_issues.append({"slide": slide_index, "check": "Accessibility Reading Order", "shape_name": s.name, "result": "FAIL", "details": f"Object '{s.name}' obscures the Title."})
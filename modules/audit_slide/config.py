@@ -1,5 +1,5 @@
 import os
-import json
+import orjson
 
 # --- CONFIG LOADER ---
 # Attempts to load user settings from data/config/brand_config.json
@@ -8,8 +8,8 @@ USER_CONFIG = {}
 try:
     config_path = os.path.join(os.path.dirname(__file__), '../data/config/brand_config.json')
     if os.path.exists(config_path):
-        with open(config_path, 'r') as f:
-            USER_CONFIG = json.load(f)
+        with open(config_path, 'rb') as f:
+            USER_CONFIG = orjson.loads(f.read())
 except: pass
 
 # --- 1. SHAPE EXEMPTIONS ---
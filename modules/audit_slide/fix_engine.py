@@ -1,7 +1,7 @@
 import os
 import copy
 import re
-import json
+import orjson
 import logging
 import math
 from datetime import datetime
@@ -37,9 +37,9 @@ def load_fixer_config():
         
         merged_config = {}
         if os.path.exists(config_path):
-            with open(config_path, 'r') as f: merged_config.update(json.load(f))
+            with open(config_path, 'rb') as f: merged_config.update(orjson.loads(f.read()))
         if os.path.exists(llm_config_path):
-            with open(llm_config_path, 'r') as f: merged_config.update(json.load(f))
+            with open(llm_config_path, 'rb') as f: merged_config.update(orjson.loads(f.read()))
         return merged_config
     except Exception as e:
         logger.warning(f"Config load failed: {e}")
@@ -121,8 +121,8 @@ class FixEngine:
         prs.save(output_path)
         
         log_path = os.path.join(output_dir, f"fix_log_{timestamp}.json")
-        with open(log_path, 'w') as f: 
-            json.dump(self.log_report, f, indent=4)
+        with open(log_path, 'wb') as f: 
+            f.write(orjson.dumps(self.log_report))
             
         return output_path
 
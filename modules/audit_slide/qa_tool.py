@@ -2,7 +2,7 @@
 
 import os
 import sys
-import json
+import orjson
 import logging
 import shutil
 from datetime import datetime
@@ -18,10 +18,19 @@ try:
     
     # Import Central Logger
     from services.logger_service import LoggerService
-    central_logger = LoggerService()
 except ImportError as e:
     print(f"CRITICAL ERROR: Missing modules in qa_tool.py. {e}")
-    central_logger = None
+    LoggerService = None
+
+# Central logger, built on first use: every spawned audit worker imports this module, and an
+# import must not start a log writer or rerun the retention sweep (the app does that once at startup)
+central_logger = None
+
+def _get_central_logger():
+    global central_logger
+    if central_logger is None and LoggerService is not None:
+        central_logger = LoggerService(run_cleanup=False)
+    return central_logger
 
 # --- LOCAL DEBUG FALLBACK ---
 # This remains as a temporary scratchpad for the Python process itself, 
@@ -39,10 +48,14 @@ if not logger.handlers:
 
 def _user_log(report_id, message, agent="ORCHESTRATOR"):
     """Helper to ensure we ONLY write to the specific User/Session log."""
-    if central_logger and report_id:
+    if report_id and _get_central_logger():
         central_logger.log_audit(report_id, "INFO", message, agent=agent)
 
-def run_audit_slide(pptx_path, output_dir):
+def run_audit_slide(pptx_path, output_dir, metadata=None):
+    """
+    Runs the full audit for one deck and writes audit_report.json plus the static reports.
+    `metadata` (e.g. {'project_name': ...}) is merged into the report summary before the single write.
+    """
     filename = os.path.basename(pptx_path)
     
     # 1. Extract Report ID from the path (e.g., data/reports/{UUID})
@@ -113,6 +126,7 @@ def run_audit_slide(pptx_path, output_dir):
     full_data = {
         "summary": {
             "presentation_name": filename,
+            "source_path": pptx_path,
             "date_generated": datetime.now().isoformat(),
             "master_slide_count": master_count,
             "total_slides_checked": total,
@@ -138,10 +152,18 @@ def run_audit_slide(pptx_path, output_dir):
         "ai_analysis": ai_results        
     }
 
-    # 7. SAVE ARTIFACTS
+    # Tag caller metadata up-front so callers never have to rewrite the report
+    if metadata:
+        full_data["summary"].update({k: v for k, v in metadata.items() if v is not None})
+
+    # 7. SAVE ARTIFACTS (compact: the report is machine-read, pretty-printing only costs CPU and disk)
     json_path = os.path.join(output_dir, 'audit_report.json')
-    with open(json_path, "w", encoding='utf-8') as f:
-        json.dump(full_data, f, indent=4)
+    # orjson writes compact UTF-8 bytes directly; slide-number dict keys need OPT_NON_STR_KEYS
+    with open(json_path, "wb") as f:
+        f.write(orjson.dumps(full_data, option=orjson.OPT_NON_STR_KEYS))
+    # Sub-KB copy of the summary for listings (ProjectIndex reads this instead of the full report)
+    with open(os.path.join(output_dir, 'summary.json'), "wb") as f:
+        f.write(orjson.dumps(full_data["summary"], option=orjson.OPT_NON_STR_KEYS))
     
     _user_log(report_id, "Generating HTML Reports...", agent="REPORT_GEN")
     
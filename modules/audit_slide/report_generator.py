@@ -1,5 +1,52 @@
 import os
-import json
+import time
+import orjson
+from functools import lru_cache
+
+# report.html / report_spa.html are shared by every report; keep them in memory,
+# pre-split at the JSON placeholder, and only re-read when the file changes.
+# {template_name: (mtime_ns, prefix_bytes, suffix_bytes)}
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+JSON_PLACEHOLDER = b'/* INSERT_JSON_HERE */'
+_TEMPLATE_CACHE = {}
+# Templates only change on deploy: stat them at most once per interval, not on every report view.
+# {template_name: time.monotonic() of the last stat}
+TEMPLATE_CHECK_INTERVAL = 5.0
+_TEMPLATE_CHECKED = {}
+
+@lru_cache(maxsize=16)
+def _resolve_template_path(template_name):
+    """Absolute path of a report template. Only a couple of names ever flow through here."""
+    return os.path.realpath(os.path.join(TEMPLATE_DIR, template_name))
+
+def get_template_parts(template_name):
+    """
+    Returns (mtime_ns, prefix, suffix) for a report template, reading the file only when it changed.
+    Edits are picked up within TEMPLATE_CHECK_INTERVAL seconds.
+    """
+    now = time.monotonic()
+    cached = _TEMPLATE_CACHE.get(template_name)
+    if cached and now - _TEMPLATE_CHECKED.get(template_name, 0) < TEMPLATE_CHECK_INTERVAL:
+        return cached
+
+    template_path = _resolve_template_path(template_name)
+    mtime = os.stat(template_path).st_mtime_ns
+    _TEMPLATE_CHECKED[template_name] = now
+    if cached and cached[0] == mtime:
+        return cached
+
+    with open(template_path, 'rb') as f: html_template = f.read()
+    prefix, _, suffix = html_template.partition(JSON_PLACEHOLDER)
+    _TEMPLATE_CACHE[template_name] = (mtime, prefix, suffix)
+    return mtime, prefix, suffix
+
+def script_safe(json_bytes):
+    """
+    Makes JSON safe to inline in a <script> block: slide text can contain '</script>' or '<!--'.
+    '<' can only occur inside JSON strings, where \\u003c decodes to the same character.
+    Byte-wise, so it can be applied chunk by chunk.
+    """
+    return json_bytes.replace(b'<', b'\\u003c')
 
 def generate_html_report(data, output_path):
     """Generates the static Executive Summary (report.html)."""
@@ -53,20 +100,17 @@ def generate_ai_context_report(analyzer, target_dir):
     return txt_path
 
 def _inject_data_into_template(template_name, data, output_path):
-    template_dir = os.path.join(os.path.dirname(__file__), 'templates')
-    template_path = os.path.join(template_dir, template_name)
-    
-    if not os.path.exists(template_path):
-        print(f"❌ Error: Template {template_name} not found in {template_dir}")
+    try:
+        _, prefix, suffix = get_template_parts(template_name)
+    except OSError:
+        print(f"❌ Error: Template {template_name} not found in {TEMPLATE_DIR}")
         return
 
-    with open(template_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-    
-    data_json = json.dumps(data)
-    injection = f"const auditData = {data_json};"
-    final_html = html_content.replace('/* INSERT_JSON_HERE */', injection)
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(final_html)
+    # Write the template halves around the data instead of building the whole page in memory
+    with open(output_path, 'wb') as f:
+        f.write(prefix)
+        f.write(b'const auditData = ')
+        f.write(script_safe(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)))
+        f.write(b';')
+        f.write(suffix)
     print(f"✅ Static report generated: {os.path.basename(output_path)}")
\ No newline at end of file
@@ -2,21 +2,40 @@
 
 import os
 import glob
-import uuid
-import json
+import gzip
+import hashlib
+import secrets
 import shutil
 import csv
 import logging
+import multiprocessing
 import importlib
 import re
-from datetime import datetime
+import atexit
+import inspect
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from datetime import datetime, timezone
 
-from flask import Blueprint, render_template, request, url_for, send_from_directory, jsonify, redirect, current_app, flash
+# Cross-process file locks (POSIX; without it only threads are serialized)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from flask import Blueprint, render_template, request, url_for, send_from_directory, jsonify, redirect, current_app, flash, abort
 from werkzeug.utils import secure_filename
+from werkzeug.exceptions import HTTPException
+from werkzeug.http import is_resource_modified
 from flask_login import login_required, current_user
+from sqlalchemy.orm import defer
 
 # --- MODULE IMPORTS ---
 from .qa_tool import run_audit_slide
+from .report_generator import get_template_parts, script_safe
 from services.ai_engine import AIEngine
 from .fix_engine import FixEngine
 from .analyzer import PptxAnalyzer 
@@ -25,6 +44,8 @@ from . import config as CFG
 # --- DATABASE EXTENSIONS ---
 from extensions import db
 import models
+from services import fastjson
+from services.view_cache import cache, current_view_key, has_pending_flashes, invalidate_views, VIEW_CACHE_TIMEOUT
 
 # --- LOGGING ---
 logger = logging.getLogger('platform_system')
@@ -32,6 +53,14 @@ logger = logging.getLogger('platform_system')
 # --- BLUEPRINT DEFINITION ---
 audit_bp = Blueprint('audit_slide', __name__, template_folder='templates')
 
+# One "term" or "term:replacement" entry per line (whitespace, incl. \r, trimmed)
+_BLACKLIST_RE = re.compile(r'^[^\S\n]*([^:\n]*?)[^\S\n]*(?::[^\S\n]*(.*?))?[^\S\n]*$', re.M)
+# Report ids: 32 hex chars (secrets.token_hex) or a dashed uuid4 from older uploads
+_REPORT_ID_RE = re.compile(r'[0-9a-f]{32}|[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12}')
+# Trimmed, non-empty items: one per line (required headers) / comma-separated (allowed fonts)
+_LINE_ITEM_RE = re.compile(r'\S(?:[^\n]*\S)?')
+_COMMA_ITEM_RE = re.compile(r'[^,\s](?:[^,]*[^,\s])?')
+
 # ==========================================
 # --- HELPER FUNCTIONS ---
 # ==========================================
@@ -46,18 +75,328 @@ def get_paths():
     upload = current_app.config.get('UPLOAD_FOLDER', os.path.join(base_dir, 'data', 'uploads'))
     output = current_app.config.get('OUTPUT_FOLDER', os.path.join(base_dir, 'data', 'reports'))
     
-    # Ensure they exist
-    os.makedirs(upload, exist_ok=True)
-    os.makedirs(output, exist_ok=True)
-    
+    # Directories (incl. remediated_decks) are created once at startup by app.py
     return upload, output
 
+# --- SHARED ENGINES ---
+# AIEngine/FixEngine parse configs and build API clients in __init__, so build them once
+# per process and config version. The version is the (mtime_ns, size) of both config files,
+# so a settings save in any worker is picked up by all of them on their next request.
+ENGINE_CONFIG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'config'))
+ENGINE_CONFIG_FILES = ('llm_config.json', 'brand_config.json')
+# (config stamp the engine was built from, engine)
+_ai_engine = (None, None)
+_fix_engine = (None, None)
+_engine_lock = threading.Lock()
+_fix_lock = threading.Lock()  # FixEngine keeps per-run state (log_report); serialize apply_fixes
+
+def _engine_config_stamp():
+    """(mtime_ns, size) of each engine config file, None for a missing one."""
+    stamp = []
+    for name in ENGINE_CONFIG_FILES:
+        try:
+            st = os.stat(f"{ENGINE_CONFIG_DIR}{os.sep}{name}")
+            stamp.append((st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            stamp.append(None)
+    return tuple(stamp)
+
+# Double-checked: while the configs are unchanged, requests read the global without the lock.
+# The local copy keeps a concurrent reset_engines() from handing back None.
+def get_ai_engine():
+    global _ai_engine
+    stamp = _engine_config_stamp()
+    built_from, engine = _ai_engine
+    if built_from != stamp:
+        with _engine_lock:
+            if _ai_engine[0] != stamp:
+                _ai_engine = (stamp, AIEngine())
+            engine = _ai_engine[1]
+    return engine
+
+def get_fix_engine():
+    global _fix_engine
+    stamp = _engine_config_stamp()
+    built_from, engine = _fix_engine
+    if built_from != stamp:
+        with _engine_lock:
+            if _fix_engine[0] != stamp:
+                _fix_engine = (stamp, FixEngine())
+            engine = _fix_engine[1]
+    return engine
+
+def warm_engines():
+    """
+    Builds both engines ahead of the first request. Never fatal. Per process, after any fork
+    (gunicorn post_fork): their HTTP/gRPC clients hold sockets and threads that don't survive one.
+    """
+    try:
+        get_ai_engine()
+        get_fix_engine()
+    except Exception as e:
+        logger.warning(f"Engine warm-up skipped, engines will build on first use: {e}")
+
+def reset_engines():
+    """Forces this process to rebuild both engines on next use (config edits are picked up anyway)."""
+    global _ai_engine, _fix_engine
+    with _engine_lock:
+        _ai_engine = (None, None)
+        _fix_engine = (None, None)
+    clear_ai_results()
+
+# --- AI RESULT CACHE ---
+# Template/boilerplate slides come back with identical content; single-slide analyses are
+# memoized by a BLAKE2b digest of the canonical payload (LRU, in memory), so repeats skip the LLM.
+# Keys also digest the llm/brand configs and the prompt code, so after a settings change or a
+# deploy every worker misses on the old answers (they age out of the LRU).
+# The cache is merged into data/ai_cache.json on shutdown and reloaded on first use.
+AI_CACHE_SIZE = 4096
+AI_CACHE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'ai_cache.json'))
+_ai_results = None
+_ai_results_lock = threading.Lock()
+# (engine config stamp, fingerprint digest)
+_ai_fingerprint = (None, b'')
+_prompt_digest = None
+
+def _prompt_code_digest():
+    """Digest of the engine and prompt source; code only changes with a restart, so computed once."""
+    global _prompt_digest
+    if _prompt_digest is None:
+        digest = hashlib.blake2b(digest_size=16)
+        for path in (inspect.getsourcefile(AIEngine), os.path.join(os.path.dirname(__file__), 'prompts.py')):
+            try:
+                with open(path, 'rb') as f: digest.update(f.read())
+            except (OSError, TypeError):
+                pass
+        _prompt_digest = digest.digest()
+    return _prompt_digest
+
+def _ai_config_fingerprint():
+    """What shapes an analysis besides the slide: providers/models/settings and the prompts."""
+    global _ai_fingerprint
+    stamp = _engine_config_stamp()
+    if _ai_fingerprint[0] != stamp:
+        configs = []
+        for name in ENGINE_CONFIG_FILES:
+            try:
+                configs.append(load_config(f"{ENGINE_CONFIG_DIR}{os.sep}{name}"))
+            except (FileNotFoundError, ValueError):
+                configs.append(None)
+        digest = hashlib.blake2b(_prompt_code_digest(), digest_size=16)
+        digest.update(fastjson.dumps(configs, sort_keys=True))
+        _ai_fingerprint = (stamp, digest.digest())
+    return _ai_fingerprint[1]
+
+def _ai_cache_key(slide_data):
+    digest = hashlib.blake2b(_ai_config_fingerprint(), digest_size=16)
+    digest.update(fastjson.dumps(slide_data, sort_keys=True))
+    return digest.hexdigest()
+
+def _load_ai_results():
+    """Returns the LRU, reading the saved cache the first time. Call with _ai_results_lock held."""
+    global _ai_results
+    if _ai_results is None:
+        try:
+            _ai_results = OrderedDict(_jload(AI_CACHE_PATH))
+        except (OSError, ValueError):
+            _ai_results = OrderedDict()
+        atexit.register(save_ai_results)
+    return _ai_results
+
+def cached_ai_analysis(slide_data):
+    """Single-slide AI analysis through the result cache. Failed/empty analyses are not cached."""
+    key = _ai_cache_key(slide_data)
+    with _ai_results_lock:
+        results = _load_ai_results()
+        if key in results:
+            results.move_to_end(key)
+            return results[key]
+
+    analysis = get_ai_engine().analyze_batch([slide_data], total_slide_count=0)
+    if not analysis:
+        return None
+    with _ai_results_lock:
+        results[key] = analysis[0]
+        while len(results) > AI_CACHE_SIZE:
+            results.popitem(last=False)
+    return analysis[0]
+
+def clear_ai_results():
+    """Frees this process's memoized analyses. Stale ones are never served anyway: keys carry the config fingerprint."""
+    with _ai_results_lock:
+        if _ai_results is not None:
+            _ai_results.clear()
+
+def save_ai_results():
+    """
+    Merges this process's results into the cache file for the next start. Never fatal.
+    Every worker saves at exit: under the file lock each one adds its entries (as the most
+    recent) to what the others already wrote, instead of replacing the file.
+    """
+    with _ai_results_lock:
+        if _ai_results is None:  # never loaded: the file on disk is already current
+            return
+        try:
+            with _file_lock(f"{AI_CACHE_PATH}.lock"):
+                try:
+                    merged = OrderedDict(_jload(AI_CACHE_PATH))
+                except (OSError, ValueError):
+                    merged = OrderedDict()
+                for key, analysis in _ai_results.items():
+                    merged.pop(key, None)
+                    merged[key] = analysis
+                while len(merged) > AI_CACHE_SIZE:
+                    merged.popitem(last=False)
+                _jdump(AI_CACHE_PATH, merged, indent=False)
+        except Exception as e:
+            logger.warning(f"Could not save AI result cache: {e}")
+
+# --- BACKGROUND AUDITS ---
+# run_audit_slide takes seconds to minutes; uploads and re-analyses queue it here and return at once.
+# {report_id: (user_id, Future)} - entries are removed on the first finished poll.
+# Jobs also record their state in <report_dir>/status.json, which /audit-status reads
+# for jobs this process no longer tracks (collected, or run by another worker).
+AUDIT_WORKERS = min(4, os.cpu_count() or 1)
+_audit_executor = ThreadPoolExecutor(max_workers=AUDIT_WORKERS, thread_name_prefix='audit')
+_audit_jobs = {}
+STATUS_FILENAME = 'status.json'
+
+# The analysis itself (python-pptx parsing, text metrics) is CPU-bound and would serialize on
+# the GIL across audit threads, so run_audit_slide runs in worker processes; the audit threads
+# only orchestrate and do the app-context (DB) work. Spawned, not forked: each child imports
+# qa_tool fresh and starts its own log writer thread.
+_audit_processes = None
+_audit_processes_lock = threading.Lock()
+
+def _run_audit_in_process(pptx_path, output_dir, metadata=None):
+    """Runs run_audit_slide on the audit process pool and waits for it (from an audit thread)."""
+    global _audit_processes
+    with _audit_processes_lock:
+        if _audit_processes is None:
+            _audit_processes = ProcessPoolExecutor(
+                max_workers=AUDIT_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+    return _audit_processes.submit(run_audit_slide, pptx_path, output_dir, metadata=metadata).result()
+
+# --- JSON I/O ---
+# Through services.fastjson (orjson): parsed/serialized in C, straight from/to bytes.
+def _jload(path):
+    """Loads a JSON file."""
+    return fastjson.load(path)
+
+def _jdump(path, obj, indent=True):
+    """
+    Writes a JSON file. Configs keep a 2-space indent for humans;
+    audit reports (indent=False) are machine-read, so they are written compact.
+    Atomic: written to a per-process temp file and renamed over the target, so an
+    interrupted write never leaves a truncated config/report behind.
+    """
+    tmp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open(tmp_path, 'wb') as f: f.write(fastjson.dumps(obj, indent=indent))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+@contextmanager
+def _file_lock(lock_path):
+    """Exclusive flock on `lock_path` (created if missing), held across processes until the block exits."""
+    with open(lock_path, 'ab') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        yield
+
+# Serializes read-modify-write of the llm/brand config files across threads and worker processes
+_config_lock = threading.Lock()
+CONFIG_LOCK_FILENAME = '.config.lock'
+
+@contextmanager
+def _config_write_lock(config_dir):
+    """The thread lock, then an exclusive flock on <config_dir>/.config.lock."""
+    with _config_lock, _file_lock(os.path.join(config_dir, CONFIG_LOCK_FILENAME)):
+        yield
+# Parsed config files: {path: ((mtime_ns, size), dict)}. Configs only change via the settings routes.
+_config_cache = {}
+
+def load_config(path):
+    """
+    Returns a fresh (shallow) copy of a JSON config file, re-parsing only when the file changed.
+    Raises FileNotFoundError like _jload when it doesn't exist.
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _config_cache.get(path)
+    if cached is None or cached[0] != key:
+        cached = (key, _jload(path))
+        _config_cache[path] = cached
+    return dict(cached[1])
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+ALLOWED_EXTENSIONS = {'.pptx', '.ppt'}
+PPTX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
+
+def has_allowed_extension(filename):
+    """Extension check on the already-sanitized name, so the validated name is the one saved."""
+    return os.path.splitext(filename)[1].lower() in ALLOWED_EXTENSIONS
+
+def save_upload(file, save_path):
+    """
+    Moves an uploaded file to its final path. Uploads spooled into the uploads folder
+    (app.UploadRequest) are hard-linked into place; other on-disk spools are copied
+    in-kernel; in-memory ones go in 1 MiB chunks.
+    """
+    # SpooledTemporaryFile keeps its buffer in ._file: BytesIO until rolled over, a real file after
+    src = getattr(file.stream, '_file', file.stream)
+    spool_path = getattr(src, 'name', None)
+    if isinstance(spool_path, str) and os.path.dirname(os.path.abspath(spool_path)) == os.path.dirname(os.path.abspath(save_path)):
+        try:
+            # Same directory, same filesystem: publish the spool under its final name (replacing any old deck)
+            src.flush()
+            tmp_link = f"{save_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+            os.link(spool_path, tmp_link)
+            os.replace(tmp_link, save_path)
+            return
+        except OSError:
+            pass  # e.g. no hard links on this filesystem - fall back to copying
+    with open(save_path, 'wb') as out:
+        try:
+            src.fileno()
+        except (AttributeError, OSError):
+            shutil.copyfileobj(file.stream, out, length=UPLOAD_CHUNK_SIZE)
+        else:
+            _append_file(out, src)
+
+def save_stream(stream, save_path):
+    """Writes a raw request body to save_path in 1 MiB chunks (constant memory), swapped in atomically."""
+    tmp_path = f"{save_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open(tmp_path, 'wb') as out:
+            shutil.copyfileobj(stream, out, length=UPLOAD_CHUNK_SIZE)
+        os.replace(tmp_path, save_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def get_project_index():
+    """Returns the shared report manifest registered by the platform controller."""
+    return current_app.extensions['project_index']
+
 def is_analysis_stale(report_dir):
     """Checks if the generated JSON report is older than the code/config."""
     json_path = os.path.join(report_dir, 'audit_report.json')
-    if not os.path.exists(json_path): return True
+    try:
+        json_mtime = os.stat(json_path).st_mtime
+    except FileNotFoundError:
+        return True
 
-    json_mtime = os.path.getmtime(json_path)
     base_dir = current_app.root_path
     config_dir = os.path.join(base_dir, 'data', 'config')
     module_path = os.path.dirname(os.path.abspath(__file__))
@@ -70,10 +409,13 @@ def is_analysis_stale(report_dir):
         os.path.join(config_dir, 'brand_config.json')
     ]
 
+    # One stat per dependency; a missing optional config simply doesn't count
     for dep in dependencies:
-        if os.path.exists(dep):
-            if os.path.getmtime(dep) > json_mtime:
+        try:
+            if os.stat(dep).st_mtime > json_mtime:
                 return True
+        except FileNotFoundError:
+            continue
     return False
 
 def generate_cadence_log(audit_output_dir, slide_data):
@@ -117,150 +459,532 @@ def generate_cadence_log(audit_output_dir, slide_data):
         logger.error(f"Error writing Cadence Log: {e}")
         return False
 
+# --- REPORT CACHE ---
+# Striped per-report locks so concurrent views of a stale report trigger a single rebuild.
+# A fixed set (report ids hash onto it) instead of one lock per id ever viewed.
+REPORT_LOCK_STRIPES = 64
+_report_locks = tuple(threading.Lock() for _ in range(REPORT_LOCK_STRIPES))
+
+def _get_report_lock(report_id):
+    return _report_locks[hash(report_id) % REPORT_LOCK_STRIPES]
+
+# Sidecar next to each cached page holding the digest of the JSON it was built from
+SOURCE_HASH_SUFFIX = '.src.b2'
+
+def _hash_file(path):
+    """blake2b hex digest (ASCII bytes) of a file, streamed in 1 MiB chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest().encode('ascii')
+
+def _append_file(out, src):
+    """Appends the rest of file `src` to `out` in-kernel (os.sendfile), falling back to a userspace copy."""
+    out.flush()
+    offset = src.tell()
+    size = os.fstat(src.fileno()).st_size
+    try:
+        while offset < size:
+            sent = os.sendfile(out.fileno(), src.fileno(), offset, size - offset)
+            if sent == 0: break
+            offset += sent
+    except (AttributeError, OSError):
+        # No file-to-file sendfile on this platform: finish with a buffered copy
+        src.seek(offset)
+        shutil.copyfileobj(src, out, length=1024 * 1024)
+
+def _cache_is_stale(cached_path, json_path, json_mtime, template_mtime):
+    """True if the cached HTML is missing, older than its template, or built from different JSON."""
+    # Only the cached page is stat'ed here; the caller already holds the JSON and template mtimes.
+    # All mtimes are integer st_mtime_ns (exact, no float rounding).
+    try:
+        cache_mtime = os.stat(cached_path).st_mtime_ns
+    except OSError:
+        return True
+    if template_mtime > cache_mtime:
+        return True
+    if json_mtime < cache_mtime:
+        return False
+
+    # JSON is as new or newer (touched, rewritten, or coarse mtimes): decide on content
+    try:
+        with open(cached_path + SOURCE_HASH_SUFFIX, 'rb') as f: built_from = f.read().strip()
+        return built_from != _hash_file(json_path)
+    except OSError:
+        return True
+
 def get_or_create_cached_report(report_id, template_name, output_filename, force_rebuild=False):
     """Ensures static HTML reports are generated and up-to-date."""
+    if not is_valid_report_id(report_id):
+        return None, 404
     _, output_folder = get_paths()
     report_dir = os.path.join(output_folder, report_id)
     json_path = os.path.join(report_dir, 'audit_report.json')
     cached_path = os.path.join(report_dir, output_filename)
-    template_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates', template_name)
 
-    if not (os.path.exists(json_path) and os.path.exists(template_path)):
+    # One stat per file: a missing JSON or template is a 404, no separate exists() checks
+    try:
+        json_mtime = os.stat(json_path).st_mtime_ns
+        template_mtime, prefix, suffix = get_template_parts(template_name)
+    except FileNotFoundError:
         return None, 404
 
-    needs_rebuild = force_rebuild
-    if not needs_rebuild:
-        if not os.path.exists(cached_path):
-            needs_rebuild = True
-        else:
-            try:
-                cache_mtime = os.path.getmtime(cached_path)
-                data_mtime = os.path.getmtime(json_path)
-                template_mtime = os.path.getmtime(template_path)
-                if data_mtime > cache_mtime or template_mtime > cache_mtime:
-                    needs_rebuild = True
-            except: needs_rebuild = True
-
-    if needs_rebuild:
+    if not (force_rebuild or _cache_is_stale(cached_path, json_path, json_mtime, template_mtime)):
+        return cached_path, 200
+
+    with _get_report_lock(report_id):
+        # Double-check: a concurrent request may have rebuilt it while we waited
         try:
-            with open(template_path, 'r', encoding='utf-8') as f: html_template = f.read()
-            with open(json_path, 'r', encoding='utf-8') as f: full_data = json.load(f)
-            
-            json_str = json.dumps(full_data)
-            final_html = html_template.replace('/* INSERT_JSON_HERE */', f"const auditData = {json_str};")
-            
-            with open(cached_path, 'w', encoding='utf-8') as f: f.write(final_html)
+            json_mtime = os.stat(json_path).st_mtime_ns
+        except FileNotFoundError:
+            return None, 404
+        if not force_rebuild and not _cache_is_stale(cached_path, json_path, json_mtime, template_mtime):
+            return cached_path, 200
+
+        # Stream the report JSON between the template halves - it was produced by
+        # run_audit_slide, so there is no need to parse and re-encode it; only '<' is escaped.
+        # Written to a temp file and swapped in atomically so readers never see a partial page.
+        tmp_path = f"{cached_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+        try:
+            source_hash = _hash_file(json_path)
+            if current_app.debug:
+                _jload(json_path)  # dev only: surface a malformed report here, not as a blank page
+            with open(tmp_path, 'wb') as out, open(json_path, 'rb') as jf:
+                out.write(prefix)
+                out.write(b'const auditData = ')
+                for chunk in iter(lambda: jf.read(UPLOAD_CHUNK_SIZE), b''):
+                    out.write(script_safe(chunk))
+                out.write(b';')
+                out.write(suffix)
+            os.replace(tmp_path, cached_path)
+            with open(cached_path + SOURCE_HASH_SUFFIX, 'wb') as f: f.write(source_hash)
         except Exception as e:
+            logger.error(f"Cached report rebuild failed for {report_id}: {e}")
+            try: os.remove(tmp_path)
+            except OSError: pass
             return None, 500
 
+        # Pre-compressed copy for gzip-capable clients (embedded JSON compresses ~10x)
+        try:
+            with open(cached_path, 'rb') as src, gzip.open(tmp_path, 'wb', compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, length=1024 * 1024)
+            os.replace(tmp_path, cached_path + '.gz')
+        except Exception as e:
+            logger.warning(f"Gzip copy of cached report {report_id} failed: {e}")
+
     return cached_path, 200
 
+# Browsers reuse a cached report for this long without asking; after that they revalidate (ETag -> 304)
+REPORT_MAX_AGE = 60
+
+def _private(response):
+    # Reports belong to one logged-in user: never let shared proxies store them
+    response.cache_control.public = False
+    response.cache_control.private = True
+    # Once max-age passes, always revalidate (cheap 304) rather than reuse a stale page
+    response.cache_control.must_revalidate = True
+    # Same URL, gzip or identity body: caches must key on the client's encodings
+    response.vary.add('Accept-Encoding')
+    return response
+
+def _file_etag(st, variant=''):
+    return f"{st.st_mtime_ns:x}-{st.st_size:x}{variant}"
+
+# Hot reports are served from memory: {path: ((mtime_ns, size), bytes)}, LRU, bounded by total size.
+# The stat key is the invalidation - a rebuilt page has a new mtime/size and is simply re-read.
+REPORT_MEMORY_CACHE_BYTES = 64 * 1024 * 1024
+_report_bytes = OrderedDict()
+_report_bytes_total = 0
+_report_bytes_lock = threading.Lock()
+
+def _cached_file_bytes(path, st):
+    """Contents of a cached report file, from memory while its (mtime_ns, size) is unchanged."""
+    global _report_bytes_total
+    key = (st.st_mtime_ns, st.st_size)
+    with _report_bytes_lock:
+        cached = _report_bytes.get(path)
+        if cached and cached[0] == key:
+            _report_bytes.move_to_end(path)
+            return cached[1]
+
+    with open(path, 'rb') as f: data = f.read()
+    if len(data) > REPORT_MEMORY_CACHE_BYTES // 4:  # one huge report shouldn't flush the rest
+        return data
+    with _report_bytes_lock:
+        old = _report_bytes.pop(path, None)
+        if old:
+            _report_bytes_total -= len(old[1])
+        _report_bytes[path] = (key, data)
+        _report_bytes_total += len(data)
+        while _report_bytes_total > REPORT_MEMORY_CACHE_BYTES:
+            _, (_, evicted) = _report_bytes.popitem(last=False)
+            _report_bytes_total -= len(evicted)
+    return data
+
+def _send_report_file(directory, filename, st, etag, mimetype=None):
+    """
+    Conditional response for one cached report file. With nginx offload (X-Sendfile) the file
+    is handed to send_from_directory; otherwise the body comes from the in-memory cache.
+    """
+    if current_app.config.get('USE_X_SENDFILE'):
+        return send_from_directory(directory, filename, mimetype=mimetype, conditional=True, etag=etag, max_age=REPORT_MAX_AGE)
+
+    response = current_app.response_class(_cached_file_bytes(os.path.join(directory, filename), st), mimetype=mimetype or 'text/html')
+    response.set_etag(etag)
+    response.last_modified = st.st_mtime
+    response.cache_control.max_age = REPORT_MAX_AGE
+    return response.make_conditional(request)
+
+def send_cached_report(path):
+    """Sends a cached report, preferring its pre-compressed .gz when the client accepts gzip."""
+    directory, filename = os.path.dirname(path), os.path.basename(path)
+    gz_path = path + '.gz'
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        abort(404)
+
+    # Parsed with q-values, so "gzip;q=0" counts as a refusal
+    if request.accept_encodings['gzip']:
+        try:
+            # Only if the .gz was built from the current HTML (run_audit_slide writes HTML alone)
+            gz_st = os.stat(gz_path)
+            if gz_st.st_mtime_ns >= st.st_mtime_ns:
+                response = _send_report_file(directory, filename + '.gz', gz_st, _file_etag(gz_st, '-gz'), mimetype='text/html')
+                response.headers['Content-Encoding'] = 'gzip'
+                return _private(response)
+        except OSError:
+            pass
+
+    # Conditional response: repeat views of an unchanged report get a 304 (ETag from mtime_ns-size)
+    return _private(_send_report_file(directory, filename, st, _file_etag(st)))
+
+# Templates a rendered page depends on, so a deploy that changes them also changes its ETag
+WORKSTATION_TEMPLATES = ('workstation.html', 'layout.html')
+_template_stamps = {}
+
+def _template_stamp(names):
+    """Newest mtime_ns among `names` on the Jinja search path. Looked up once unless templates auto-reload."""
+    stamp = _template_stamps.get(names)
+    if stamp is None or current_app.jinja_env.auto_reload:
+        stamp = 0
+        for name in names:
+            for directory in current_app.jinja_loader.searchpath:
+                try:
+                    stamp = max(stamp, os.stat(os.path.join(directory, name)).st_mtime_ns)
+                    break
+                except OSError:
+                    continue
+        _template_stamps[names] = stamp
+    return stamp
+
 # ==========================================
 # --- ROUTES ---
 # ==========================================
 
+def is_valid_report_id(report_id):
+    # Ids also arrive in JSON bodies: numbers, lists or objects are simply invalid
+    return isinstance(report_id, str) and _REPORT_ID_RE.fullmatch(report_id) is not None
+
+@audit_bp.url_value_preprocessor
+def validate_report_id(endpoint, values):
+    """
+    Every <report_id> URL segment must look like an id we issued. It is joined into
+    report/upload paths (and rmtree'd on delete), so '..' or separators never get that far.
+    """
+    if values and 'report_id' in values and not is_valid_report_id(values['report_id']):
+        abort(404)
+
+@audit_bp.before_request
+def log_page_views():
+    """Access logging for the cached pages (runs on cache hits too)."""
+    if not current_user.is_authenticated:
+        return
+    if request.endpoint == 'audit_slide.projects_page':
+        logger.info(f"Projects page accessed by {current_user.email}")
+    elif request.endpoint == 'audit_slide.settings':
+        logger.info("Settings page accessed")
+
+@dataclass(slots=True)
+class ProjectFile:
+    """One row of the projects page (templates read it by attribute: file.id, file.score, ...)."""
+    id: str
+    filename: str
+    date: str
+    score: float
+    issues: int
+
 @audit_bp.route('/projects')
 @login_required
+@cache.cached(timeout=VIEW_CACHE_TIMEOUT, key_prefix=current_view_key, unless=has_pending_flashes)
 def projects_page():
     """
-    Lists all audit projects for the current user.
+    Lists all audit projects for the current user, grouped by project name.
     Loads primarily from Database for speed and security.
     """
-    logger.info(f"Projects page accessed by {current_user.email}")
+    # DB Load (summary columns only - the full report JSON is deferred)
+    user_projects = models.Project.query.options(defer(models.Project.report_data)) \
+        .filter_by(user_id=current_user.id).order_by(models.Project.created_at.desc()).all()
+    
+    # Group in memory (query is already newest-first)
+    projects = {}
+    for proj in user_projects:
+        projects.setdefault(proj.project_name, []).append(ProjectFile(
+            id=proj.id,
+            filename=proj.filename,
+            date=proj.created_at.strftime('%Y-%m-%d') if proj.created_at else '',
+            score=proj.compliance_score or 0,
+            issues=proj.total_issues or 0
+        ))
+    
+    return render_template('projects.html', active_page='projects', projects=projects)
+
+def _write_status(audit_output_dir, user_id, state, message=None):
+    _jdump(os.path.join(audit_output_dir, STATUS_FILENAME), {
+        "status": state, "user_id": user_id, "message": message,
+        "updated": datetime.now().isoformat()
+    }, indent=False)
+
+def recover_interrupted_audits(output_folder):
+    """
+    Marks audits a previous server process left 'queued' or 'running' as failed: their pool died
+    with it, so /audit-status would otherwise report them in progress forever. Only from
+    app.run_startup_tasks: once per server start, before any process has queued jobs.
+    """
+    interrupted = 0
+    try:
+        with os.scandir(output_folder) as it:
+            report_dirs = [entry.path for entry in it if entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return 0
+
+    for report_dir in report_dirs:
+        try:
+            status = _jload(f"{report_dir}{os.sep}{STATUS_FILENAME}")
+        except (OSError, ValueError):
+            continue  # no tracked job (older report) or unreadable
+        if status.get('status') in ('queued', 'running'):
+            _write_status(report_dir, status.get('user_id'), 'error', "Interrupted by a server restart. Please upload the deck again.")
+            interrupted += 1
+
+    if interrupted:
+        logger.warning(f"Marked {interrupted} audit(s) interrupted by the last shutdown as failed")
+    return interrupted
+
+def _run_tracked_job(app, user_id, report_id, audit_output_dir, job, *args):
+    """Runs `job` on the audit pool inside its own app context, recording its state in status.json."""
+    with app.app_context():
+        _write_status(audit_output_dir, user_id, 'running')
+        try:
+            job(*args)
+        except Exception as e:
+            logger.error(f"Audit failed for {report_id}: {e}")
+            _write_status(audit_output_dir, user_id, 'error', str(e))
+            raise
+        _write_status(audit_output_dir, user_id, 'done')
+
+def _submit_audit(report_id, audit_output_dir, job, *args):
+    """Queues an audit job for the current user. Call from a request."""
+    # Recorded before submit, so any worker can answer a poll that arrives before the job starts
+    _write_status(audit_output_dir, current_user.id, 'queued')
+    future = _audit_executor.submit(
+        _run_tracked_job, current_app._get_current_object(), current_user.id,
+        report_id, audit_output_dir, job, *args
+    )
+    _audit_jobs[report_id] = (current_user.id, future)
+
+def _run_audit_job(user_id, unique_id, filename, save_path, audit_output_dir, project_name):
+    """Audit + post-processing for a new upload."""
+    # 3. RUN ANALYSIS (project name is written into the report summary directly)
+    _run_audit_in_process(save_path, audit_output_dir, metadata={'project_name': project_name})
+    
+    # 4. POST-PROCESSING
+    json_path = os.path.join(audit_output_dir, 'audit_report.json')
+    
+    try:
+        data = _jload(json_path)
+    except FileNotFoundError:
+        return  # the audit wrote no report
+    generate_cadence_log(audit_output_dir, data.get('slide_content', {}))
+
+    # 5. SAVE TO DATABASE (Hybrid Persistence)
+    try:
+        new_project = models.Project(
+            id=unique_id,
+            user_id=user_id,
+            project_name=project_name or data['summary']['presentation_name'],
+            module_type='audit_slide',
+            filename=filename,
+            file_path=save_path,
+            report_data=data, 
+            compliance_score=data.get('summary', {}).get('executive_metrics', {}).get('wcag_compliance_rate', 0),
+            total_issues=data.get('summary', {}).get('total_errors', 0)
+        )
+        db.session.add(new_project)
+        db.session.commit()
+        logger.info(f"Project {unique_id} synced to DB.")
+    except Exception as db_e:
+        db.session.rollback()
+        logger.error(f"DB Write Failed (File saved OK): {db_e}")
+
+    get_project_index().upsert(unique_id, data['summary'], source_path=save_path)
+    invalidate_views()
+
+def _run_reanalysis_job(report_id, filename, save_path, audit_output_dir, project_name):
+    """Re-audit of an existing project with a replacement deck."""
+    # Keep the report's project tag and original deck name across re-analysis
+    _run_audit_in_process(save_path, audit_output_dir, metadata={
+        'project_name': project_name,
+        'presentation_name': filename
+    })
     
-    # DB Load
-    user_projects = models.Project.query.filter_by(user_id=current_user.id).order_by(models.Project.created_at.desc()).all()
+    # Refresh Logs and DB
+    json_path = os.path.join(audit_output_dir, 'audit_report.json')
+    try:
+        data = _jload(json_path)
+    except FileNotFoundError:
+        return  # the audit wrote no report
+    generate_cadence_log(audit_output_dir, data.get('slide_content', {}))
     
-    return render_template('projects.html', active_page='projects', projects=user_projects)
+    # Update DB
+    project = models.Project.query.filter_by(id=report_id).first()
+    if project:
+        project.report_data = data
+        db.session.commit()
+    get_project_index().upsert(report_id, data['summary'], source_path=save_path)
+    invalidate_views()
 
 @audit_bp.route('/upload', methods=['POST'])
 @login_required
 def upload_file():
     """
-    Handles file upload, runs analysis, and saves to DB.
+    Handles file upload and queues the analysis (results are saved to DB by the job).
     Includes GATEKEEPER logic to restrict Free users.
+    Returns 202 with the session_id; poll /audit-status/<session_id> for completion.
     """
     # 1. GATEKEEPER CHECK (SaaS Security)
-    allowed_tiers = ['pro', 'enterprise']
-    if current_user.subscription_tier not in allowed_tiers:
-        logger.warning(f"Access Denied: User {current_user.email} (Tier: {current_user.subscription_tier}) tried to upload.")
-        return jsonify({"status": "error", "message": "Access Restricted. Please upgrade to Pro or Enterprise."}), 403
+    denied = _upload_denied()
+    if denied: return denied
 
     # 2. File Validation
     if 'file' not in request.files: return jsonify({"status": "error", "message": "No file uploaded"}), 400
     file = request.files['file']
     if file.filename == '': return jsonify({"status": "error", "message": "No file selected"}), 400
 
-    if file and file.filename.lower().endswith(('.pptx', '.ppt')):
+    filename = secure_filename(file.filename)
+    if has_allowed_extension(filename):
         try:
-            filename = secure_filename(file.filename)
-            unique_id = str(uuid.uuid4()) # Generate Project ID
-            
-            upload_folder, output_folder = get_paths()
-            
             # Save Path
+            upload_folder, _ = get_paths()
             save_path = os.path.join(upload_folder, filename)
-            file.save(save_path)
+            save_upload(file, save_path)
             
-            # Output Directory
-            audit_output_dir = os.path.join(output_folder, unique_id)
-            os.makedirs(audit_output_dir, exist_ok=True)
-            
-            logger.info(f"Starting audit for {filename} ({unique_id})")
-            
-            # 3. RUN ANALYSIS
-            run_audit_slide(save_path, audit_output_dir)
-            
-            # 4. POST-PROCESSING
-            project_name = request.form.get('project_name')
-            json_path = os.path.join(audit_output_dir, 'audit_report.json')
-            
-            if os.path.exists(json_path):
-                with open(json_path, 'r') as f: data = json.load(f)
-                
-                # Update JSON Metadata
-                if project_name: data['summary']['project_name'] = project_name
-                generate_cadence_log(audit_output_dir, data.get('slide_content', {}))
-                with open(json_path, 'w') as f: json.dump(data, f, indent=4)
-
-                # 5. SAVE TO DATABASE (Hybrid Persistence)
-                try:
-                    new_project = models.Project(
-                        id=unique_id,
-                        user_id=current_user.id,
-                        project_name=project_name or data['summary']['presentation_name'],
-                        module_type='audit_slide',
-                        filename=filename,
-                        file_path=save_path,
-                        report_data=data, 
-                        compliance_score=data.get('summary', {}).get('executive_metrics', {}).get('wcag_compliance_rate', 0),
-                        total_issues=data.get('summary', {}).get('total_errors', 0)
-                    )
-                    db.session.add(new_project)
-                    db.session.commit()
-                    logger.info(f"Project {unique_id} synced to DB.")
-                except Exception as db_e:
-                    db.session.rollback()
-                    logger.error(f"DB Write Failed (File saved OK): {db_e}")
-
-            return jsonify({"status": "success", "session_id": unique_id})
+            # 3. QUEUE ANALYSIS + POST-PROCESSING
+            return _queue_upload_audit(filename, save_path, request.form.get('project_name'))
         except Exception as e:
             logger.error(f"Audit failed: {e}")
             return jsonify({"status": "error", "message": str(e)}), 500
             
     return jsonify({"status": "error", "message": "Invalid file type. Only .pptx allowed."}), 400
 
+@audit_bp.route('/upload-stream', methods=['POST'])
+@login_required
+def upload_stream():
+    """
+    Upload for large decks: the raw request body is the file (no multipart encoding),
+    written to disk as it arrives. Name in X-Filename, optional project in X-Project-Name.
+    Same response as /upload.
+    """
+    denied = _upload_denied()
+    if denied: return denied
+
+    filename = secure_filename(request.headers.get('X-Filename', ''))
+    if not filename: return jsonify({"status": "error", "message": "Missing X-Filename header"}), 400
+    if not has_allowed_extension(filename):
+        return jsonify({"status": "error", "message": "Invalid file type. Only .pptx allowed."}), 400
+
+    try:
+        upload_folder, _ = get_paths()
+        save_path = os.path.join(upload_folder, filename)
+        save_stream(request.stream, save_path)
+        return _queue_upload_audit(filename, save_path, request.headers.get('X-Project-Name') or None)
+    except HTTPException:
+        raise  # e.g. 413 over MAX_CONTENT_LENGTH
+    except Exception as e:
+        logger.error(f"Audit failed: {e}")
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+def _upload_denied():
+    """Tier gate shared by the upload routes: an error response, or None if the user may upload."""
+    allowed_tiers = ['pro', 'enterprise']
+    if current_user.subscription_tier not in allowed_tiers:
+        logger.warning(f"Access Denied: User {current_user.email} (Tier: {current_user.subscription_tier}) tried to upload.")
+        return jsonify({"status": "error", "message": "Access Restricted. Please upgrade to Pro or Enterprise."}), 403
+    return None
+
+def _queue_upload_audit(filename, save_path, project_name):
+    """Creates the report folder for a saved upload and queues its audit. Returns the 202 response."""
+    unique_id = secrets.token_hex(16) # Generate Project ID (128-bit, 32 hex chars)
+    _, output_folder = get_paths()
+    
+    # Output Directory
+    audit_output_dir = os.path.join(output_folder, unique_id)
+    os.mkdir(audit_output_dir)  # Fresh id under an existing folder
+    
+    logger.info(f"Queueing audit for {filename} ({unique_id})")
+    _submit_audit(
+        unique_id, audit_output_dir, _run_audit_job,
+        current_user.id, unique_id, filename, save_path, audit_output_dir, project_name
+    )
+    return jsonify({"status": "queued", "session_id": unique_id}), 202
+
+@audit_bp.route('/audit-status/<report_id>')
+@login_required
+def audit_status(report_id):
+    """Polling endpoint for queued audits and re-analyses: queued | running | done | error."""
+    job = _audit_jobs.get(report_id)
+    if job is None or job[0] != current_user.id:
+        # Not tracked here: fall back to the job's status.json, then to the DB row
+        try:
+            status = _jload(os.path.join(get_paths()[1], secure_filename(report_id), STATUS_FILENAME))
+        except (OSError, ValueError):
+            status = None
+        if status and status.get('user_id') == current_user.id:
+            code = 500 if status['status'] == 'error' else 200
+            return jsonify({"status": status['status'], "session_id": report_id, "message": status.get('message')}), code
+
+        project = models.Project.query.options(defer(models.Project.report_data)).filter_by(id=report_id, user_id=current_user.id).first()
+        if not project: return jsonify({"status": "error", "message": "Unknown audit"}), 404
+        return jsonify({"status": "done", "session_id": report_id})
+
+    _, future = job
+    if not future.done():
+        # Audits wait for a free slot on the pool (AUDIT_WORKERS) before they start
+        return jsonify({"status": "running" if future.running() else "queued", "session_id": report_id})
+
+    _audit_jobs.pop(report_id, None)
+    error = future.exception()
+    if error:
+        return jsonify({"status": "error", "session_id": report_id, "message": str(error)}), 500
+    return jsonify({"status": "done", "session_id": report_id})
+
 @audit_bp.route('/new-audit')
 @login_required
 def new_audit():
     # Load defaults for the settings dropdown
     config_dir = os.path.join(current_app.root_path, 'data', 'config')
     llm_config_path = os.path.join(config_dir, 'llm_config.json')
-    defaults = {}
-    if os.path.exists(llm_config_path):
-        with open(llm_config_path, 'r') as f: defaults = json.load(f)
+    try:
+        defaults = load_config(llm_config_path)
+    except FileNotFoundError:
+        defaults = {}
+    
+    # Existing project names for the "Add to Project" dropdown (single DB query)
+    name_rows = db.session.query(models.Project.project_name).filter_by(user_id=current_user.id).distinct().all()
+    existing_projects = sorted(name for (name,) in name_rows if name)
         
-    return render_template('new_audit.html', active_page='projects', defaults=defaults)
+    return render_template('new_audit.html', active_page='projects', defaults=defaults, existing_projects=existing_projects)
 
 @audit_bp.route('/view-report/<report_id>')
 @login_required
@@ -279,11 +1003,19 @@ def view_report(report_id):
     force_rebuild = False
     if os.path.exists(json_path) and is_analysis_stale(report_dir):
         logger.info(f"Report {report_id} is stale. Re-running logic...")
+        summary_path = os.path.join(report_dir, 'summary.json')
         try:
-            with open(json_path, 'r') as f: old_data = json.load(f)
-            filename = old_data.get('summary', {}).get('presentation_name')
+            # Only summary fields are needed: read the sub-KB sidecar, not the full report
+            try:
+                old_summary = _jload(summary_path)
+            except (OSError, ValueError):
+                old_summary = _jload(json_path).get('summary', {})
+            filename = old_summary.get('presentation_name')
             if filename:
-                pptx_path = os.path.join(upload_folder, filename)
+                # The report records where its deck was uploaded; older reports fall back to the uploads folder
+                pptx_path = old_summary.get('source_path') or os.path.join(upload_folder, filename)
+                if not os.path.exists(pptx_path):
+                    pptx_path = os.path.join(upload_folder, filename)
                 # Fallback search if exact path missing
                 if not os.path.exists(pptx_path):
                      matches = glob.glob(os.path.join(upload_folder, f"*{filename}"))
@@ -300,29 +1032,55 @@ def view_report(report_id):
                     new_data = dict(hybrid_result)
                     
                     # Restore ID info
-                    new_data['summary']['project_name'] = old_data.get('summary', {}).get('project_name')
-                    with open(json_path, 'w') as f: json.dump(new_data, f, indent=4)
+                    new_data['summary']['project_name'] = old_summary.get('project_name')
+                    new_data['summary']['source_path'] = pptx_path
+                    _jdump(json_path, new_data, indent=False)
+                    _jdump(summary_path, new_data['summary'], indent=False)
                     force_rebuild = True
                     
                     # Update DB Record
                     project.report_data = new_data
                     db.session.commit()
+                    get_project_index().upsert(report_id, new_data['summary'], source_path=pptx_path)
+                    invalidate_views()
         except Exception as e:
              logger.error(f"Auto-update failed: {e}")
 
     # 2. Render Cached HTML
     path, status = get_or_create_cached_report(report_id, 'report.html', 'Printable Executive Summary.html', force_rebuild=force_rebuild)
     if status != 200: return f"Error: {status}", status
-    return send_from_directory(os.path.dirname(path), os.path.basename(path))
+    return send_cached_report(path)
 
 @audit_bp.route('/view-workstation/<report_id>')
 @login_required
 def view_workstation(report_id):
-    project = models.Project.query.filter_by(id=report_id, user_id=current_user.id).first()
-    if not project or not project.report_data:
+    # Ownership check without the report JSON: an unchanged page is answered before it is loaded
+    project = models.Project.query.options(defer(models.Project.report_data)) \
+        .filter_by(id=report_id, user_id=current_user.id).first()
+    if not project:
         return "Error: Audit report not found or access denied.", 404
-        
-    return render_template('workstation.html', active_page='projects', audit_data=project.report_data)
+
+    # Every report_data update rewrites audit_report.json first, so its stat versions the page
+    _, output_folder = get_paths()
+    try:
+        st = os.stat(f"{output_folder}{os.sep}{report_id}{os.sep}audit_report.json")
+    except OSError:
+        st = None
+    if st is not None:
+        etag = _file_etag(st, f"-ws{_template_stamp(WORKSTATION_TEMPLATES):x}")
+        if not is_resource_modified(request.environ, etag=etag, last_modified=datetime.fromtimestamp(st.st_mtime, timezone.utc)):
+            response = current_app.response_class(status=304)
+            response.set_etag(etag)
+            return _private(response)
+
+    if not project.report_data:
+        return "Error: Audit report not found or access denied.", 404
+
+    response = current_app.make_response(render_template('workstation.html', active_page='projects', audit_data=project.report_data))
+    if st is not None:
+        response.set_etag(etag)
+        response.last_modified = st.st_mtime
+    return _private(response)
 
 @audit_bp.route('/delete/<report_id>', methods=['POST'])
 @login_required
@@ -333,11 +1091,15 @@ def delete_report(report_id):
         return jsonify({"status": "error", "message": "Project not found or access denied"}), 404
 
     _, output_folder = get_paths()
-    path = os.path.join(output_folder, report_id)
+    path = f"{output_folder}{os.sep}{report_id}"
     
-    # 1. Delete from File System
-    if os.path.exists(path):
+    # 1. Delete from File System (rmtree walks with os.scandir; no separate exists() stat)
+    try:
         shutil.rmtree(path)
+    except FileNotFoundError:
+        pass
+    get_project_index().drop(report_id)
+    invalidate_views()
         
     # 2. Delete from Database
     try:
@@ -358,29 +1120,68 @@ def delete_project_group():
     if not target_project: 
         return jsonify({"status": "error", "message": "Missing project name"}), 400
     
-    deleted_count = 0
     _, output_folder = get_paths()
     
     try:
-        # Delete only projects owned by current user
-        projects_to_delete = models.Project.query.filter_by(project_name=target_project, user_id=current_user.id).all()
-        for proj in projects_to_delete:
-            path = os.path.join(output_folder, proj.id)
-            if os.path.exists(path):
-                shutil.rmtree(path)
-            
-            db.session.delete(proj)
-            deleted_count += 1
-            
+        # Delete only projects owned by current user. Only the ids are selected - the
+        # report_data JSON column is never loaded - and the rows go in one bulk DELETE.
+        group_query = models.Project.query.filter_by(project_name=target_project, user_id=current_user.id)
+        report_ids = [report_id for (report_id,) in group_query.with_entities(models.Project.id)]
+        group_query.delete(synchronize_session=False)
         db.session.commit()
-        logger.info(f"Deleted project group '{target_project}' ({deleted_count} items)")
+        # Listings stop showing the group now; the folders are removed in the background
+        get_project_index().drop(*report_ids)
+        invalidate_views()
         
     except Exception as e:
         db.session.rollback()
         logger.error(f"Group deletion failed: {e}")
         return jsonify({"status": "error", "message": str(e)}), 500
 
-    return jsonify({"status": "success", "deleted_count": deleted_count})
+    # Renamed out of the reports folder now (so no rescan can list them again), removed in the background
+    trashed = _move_to_trash(output_folder, report_ids)
+    threading.Thread(target=_bulk_delete, args=(target_project, trashed), name='delete-group', daemon=True).start()
+    return jsonify({"status": "success", "deleted_count": len(report_ids), "async": True})
+
+# Deleted report folders are renamed in here (same filesystem: instant) and removed afterwards.
+# Dot-named, so never a report id and skipped by the index scan; leftovers of an interrupted
+# removal are purged at the next startup (purge_trash).
+TRASH_DIRNAME = '.trash'
+
+def _move_to_trash(output_folder, report_ids):
+    """Renames the reports' folders into the trash folder and returns their new paths."""
+    trash_dir = f"{output_folder}{os.sep}{TRASH_DIRNAME}"
+    os.makedirs(trash_dir, exist_ok=True)
+    trashed = []
+    for report_id in report_ids:
+        report_dir = f"{output_folder}{os.sep}{report_id}"
+        trash_path = f"{trash_dir}{os.sep}{report_id}-{secrets.token_hex(4)}"
+        try:
+            os.rename(report_dir, trash_path)
+        except FileNotFoundError:
+            continue
+        except OSError:
+            shutil.rmtree(report_dir, ignore_errors=True)  # can't be moved: remove it in place, now
+            continue
+        trashed.append(trash_path)
+    return trashed
+
+def purge_trash(output_folder):
+    """Removes report folders a previous process moved to the trash but didn't finish deleting."""
+    shutil.rmtree(f"{output_folder}{os.sep}{TRASH_DIRNAME}", ignore_errors=True)
+
+# Concurrent folder removals per group delete (unlink/rmdir release the GIL)
+DELETE_WORKERS = 8
+
+def _bulk_delete(target_project, report_dirs):
+    """Removes a deleted group's report folders off the request thread, several at a time (I/O-bound)."""
+    if not report_dirs:
+        return
+    with ThreadPoolExecutor(max_workers=min(DELETE_WORKERS, len(report_dirs)), thread_name_prefix='delete-group') as pool:
+        # Drain the iterator so every rmtree has finished before logging
+        for _ in pool.map(lambda report_dir: shutil.rmtree(report_dir, ignore_errors=True), report_dirs):
+            pass
+    logger.info(f"Deleted project group '{target_project}' ({len(report_dirs)} items)")
 
 @audit_bp.route('/reanalyze/<report_id>', methods=['POST'])
 @login_required
@@ -392,28 +1193,22 @@ def reanalyze_deck(report_id):
     if 'file' not in request.files: return jsonify({"status": "error", "message": "No file uploaded"}), 400
     file = request.files['file']
     
-    if file and file.filename.lower().endswith(('.pptx', '.ppt')):
+    filename = secure_filename(file.filename)
+    if has_allowed_extension(filename):
         try:
             upload_folder, output_folder = get_paths()
             
             audit_output_dir = os.path.join(output_folder, report_id)
-            filename = secure_filename(file.filename)
             save_path = os.path.join(upload_folder, f"{report_id}_{filename}")
-            file.save(save_path)
+            save_upload(file, save_path)
             
-            run_audit_slide(save_path, audit_output_dir)
+            # Queue the re-audit; the client polls /audit-status/<report_id>
+            _submit_audit(
+                report_id, audit_output_dir, _run_reanalysis_job,
+                report_id, filename, save_path, audit_output_dir, project.project_name
+            )
             
-            # Refresh Logs and DB
-            json_path = os.path.join(audit_output_dir, 'audit_report.json')
-            if os.path.exists(json_path):
-                with open(json_path, 'r') as f: data = json.load(f)
-                generate_cadence_log(audit_output_dir, data.get('slide_content', {}))
-                
-                # Update DB
-                project.report_data = data
-                db.session.commit()
-            
-            return jsonify({"status": "success", "message": "Re-analysis complete"})
+            return jsonify({"status": "queued", "session_id": report_id, "message": "Re-analysis queued"}), 202
         except Exception as e:
             return jsonify({"status": "error", "message": str(e)}), 500
     return jsonify({"status": "error", "message": "Invalid file type"}), 400
@@ -422,8 +1217,11 @@ def reanalyze_deck(report_id):
 @login_required
 def apply_fix_batch():
     data = request.json
-    filename = data.get('filename')
+    # Both are joined into paths below: keep the file name a bare name, ignore malformed ids
+    filename = os.path.basename(data.get('filename') or '')
     fixes = data.get('fixes')
+    report_id = data.get('report_id')
+    if not is_valid_report_id(report_id): report_id = None
     
     if not filename or not fixes: 
         return jsonify({"status": "error", "message": "Missing filename or fixes"}), 400
@@ -431,22 +1229,38 @@ def apply_fix_batch():
     upload_folder, output_folder = get_paths()
     
     input_path = os.path.join(upload_folder, filename)
-    # Search fallback if not found directly
+    # Fallback 1: upload path recorded in the report manifest (O(1) by report_id)
+    if not os.path.exists(input_path):
+        input_path = get_project_index().find_source(filename=filename, report_id=report_id) or input_path
+    if not os.path.exists(input_path) and report_id:
+        # Fallback 2: the deck path recorded in the report's own summary.json (survives a lost manifest)
+        try:
+            summary = _jload(os.path.join(output_folder, secure_filename(report_id), 'summary.json'))
+            input_path = summary.get('source_path') or input_path
+        except (OSError, ValueError):
+            pass
+        # Fallback 3: re-analysis uploads are saved as <report_id>_<filename>
+        if not os.path.exists(input_path):
+            candidate = os.path.join(upload_folder, secure_filename(f"{report_id}_{filename}"))
+            if os.path.exists(candidate): input_path = candidate
+    # Fallback 4 (last resort): look one level into each report folder (DirEntry types, no recursive walk)
     if not os.path.exists(input_path):
-        for root, _, files in os.walk(output_folder):
-            if filename in files:
-                input_path = os.path.join(root, filename)
-                break
+        with os.scandir(output_folder) as it:
+            for entry in it:
+                candidate = f"{entry.path}{os.sep}{filename}"
+                if entry.is_dir(follow_symlinks=False) and os.path.isfile(candidate):
+                    input_path = candidate
+                    break
     
     if not os.path.exists(input_path):
         return jsonify({"status": "error", "message": "Original file not found"}), 404
 
     try:
-        engine = FixEngine()
+        engine = get_fix_engine()
         remediated_dir = os.path.join(output_folder, 'remediated_decks')
-        os.makedirs(remediated_dir, exist_ok=True)
         
-        new_file_path = engine.apply_fixes(input_path, fixes, remediated_dir)
+        with _fix_lock:
+            new_file_path = engine.apply_fixes(input_path, fixes, remediated_dir)
         
         if new_file_path:
             rel_name = os.path.basename(new_file_path)
@@ -463,7 +1277,9 @@ def apply_fix_batch():
 def download_fixed(filename):
     _, output_folder = get_paths()
     directory = os.path.join(output_folder, 'remediated_decks')
-    return send_from_directory(directory, filename, as_attachment=True)
+    # send_file hands the open file to the server's wsgi.file_wrapper (sendfile under gunicorn),
+    # or to nginx via X-Accel-Redirect; the explicit type skips the mimetypes lookup
+    return send_from_directory(directory, filename, as_attachment=True, conditional=True, mimetype=PPTX_MIMETYPE)
 
 # --- AI ENDPOINTS ---
 
@@ -476,7 +1292,7 @@ def run_ai_batch():
         slides = data.get('slides', [])
         total_count = data.get('total_slides', 0)
         
-        engine = AIEngine()
+        engine = get_ai_engine()
         results = engine.analyze_batch(slides, total_slide_count=total_count)
         
         return jsonify({"status": "success", "data": results})
@@ -489,11 +1305,10 @@ def run_ai_agent():
     """Endpoint for Single Slide Analysis."""
     try:
         slide_data = request.json
-        engine = AIEngine()
-        results = engine.analyze_batch([slide_data], total_slide_count=0)
+        result = cached_ai_analysis(slide_data)
         
-        if results:
-            return jsonify({"status": "success", "data": results[0]})
+        if result:
+            return jsonify({"status": "success", "data": result})
         else:
             return jsonify({"status": "error", "message": "No data returned"}), 500
     except Exception as e:
@@ -510,13 +1325,13 @@ def run_executive_summary(report_id):
     json_path = os.path.join(output_folder, report_id, 'audit_report.json')
     
     try:
-        with open(json_path, 'r') as f: full_data = json.load(f)
-        ai_engine = AIEngine()
+        full_data = _jload(json_path)
+        ai_engine = get_ai_engine()
         summary_text = ai_engine.generate_executive_summary(full_data['summary'], report_id)
         
         # Save back to JSON and DB
         full_data['executive_summary'] = summary_text
-        with open(json_path, 'w') as f: json.dump(full_data, f, indent=4)
+        _jdump(json_path, full_data, indent=False)
         
         project.report_data = full_data
         db.session.commit()
@@ -531,31 +1346,28 @@ def run_executive_summary(report_id):
 
 @audit_bp.route('/settings')
 @login_required
+@cache.cached(timeout=VIEW_CACHE_TIMEOUT, key_prefix=current_view_key, unless=has_pending_flashes)
 def settings():
-    logger.info("Settings page accessed")
     config_dir = os.path.join(current_app.root_path, 'data', 'config')
     
     llm_config_path = os.path.join(config_dir, 'llm_config.json')
     brand_config_path = os.path.join(config_dir, 'brand_config.json')
     
-    llm_config = {}
-    brand_config = {}
-    
-    if os.path.exists(llm_config_path):
-        with open(llm_config_path, 'r') as f: llm_config = json.load(f)
-    if os.path.exists(brand_config_path):
-        with open(brand_config_path, 'r') as f: brand_config = json.load(f)
+    # Missing files mean defaults: open() once instead of exists() + open()
+    try:
+        llm_config = load_config(llm_config_path)
+    except FileNotFoundError:
+        llm_config = {}
+    try:
+        brand_config = load_config(brand_config_path)
+    except FileNotFoundError:
+        brand_config = {}
     
-    # Format Blacklist for Display
+    # Blacklist is formatted for display by the template (term:replacement per line)
     llm_config.setdefault('default_buffer', getattr(CFG, 'BUFFER_ACTIVITY_SLIDE', 5.0))
-    if 'blacklist' in llm_config:
-        val = llm_config['blacklist']; display_str = ""
-        if isinstance(val, dict):
-            for k, v in val.items(): display_str += f"{k}:{v}\n" if v else f"{k}\n"
-        else: display_str = str(val)
-        llm_config['blacklist_display'] = display_str.strip()
+    blacklist = llm_config.get('blacklist') or {}
 
-    return render_template('settings.html', active_page='settings', config=llm_config, brand_config=brand_config)
+    return render_template('settings.html', active_page='settings', config=llm_config, brand_config=brand_config, blacklist=blacklist)
 
 @audit_bp.route('/save-settings', methods=['POST'])
 @login_required
@@ -565,13 +1377,7 @@ def save_settings():
     
     # Process Blacklist
     raw_text = form_data.get('blacklist', '')
-    blacklist_dict = {}
-    for line in raw_text.splitlines():
-        if line.strip():
-            parts = line.split(':', 1)
-            key = parts[0].strip().lower()
-            val = parts[1].strip() if len(parts) > 1 else ""
-            blacklist_dict[key] = val
+    blacklist_dict = {term.lower(): replacement for term, replacement in _BLACKLIST_RE.findall(raw_text) if term}
 
     # LLM Settings
     llm_keys = [
@@ -585,11 +1391,8 @@ def save_settings():
     llm_config['blacklist'] = blacklist_dict
 
     # Brand Settings
-    raw_headers = form_data.get('required_headers', '')
-    headers_list = [h.strip() for h in raw_headers.splitlines() if h.strip()]
-    
-    raw_allowed = form_data.get('allowed_fonts', '')
-    allowed_list = [x.strip() for x in raw_allowed.split(',') if x.strip()]
+    headers_list = _LINE_ITEM_RE.findall(form_data.get('required_headers', ''))
+    allowed_list = _COMMA_ITEM_RE.findall(form_data.get('allowed_fonts', ''))
 
     brand_config = {
         'title_font': form_data.get('title_font'),
@@ -606,10 +1409,11 @@ def save_settings():
     
     config_dir = os.path.join(current_app.root_path, 'data', 'config')
     try:
-        with open(os.path.join(config_dir, 'llm_config.json'), 'w') as f: 
-            json.dump(llm_config, f, indent=4)
-        with open(os.path.join(config_dir, 'brand_config.json'), 'w') as f: 
-            json.dump(brand_config, f, indent=4)
+        with _config_write_lock(config_dir):
+            _jdump(os.path.join(config_dir, 'llm_config.json'), llm_config)
+            _jdump(os.path.join(config_dir, 'brand_config.json'), brand_config)
+        reset_engines()
+        invalidate_views()
         return jsonify({"status": "success"})
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
@@ -621,8 +1425,19 @@ def update_llm_settings():
     config_dir = os.path.join(current_app.root_path, 'data', 'config')
     config_path = os.path.join(config_dir, 'llm_config.json')
     try:
-        with open(config_path, 'r') as f: current_config = json.load(f)
-        current_config.update(new_settings)
-        with open(config_path, 'w') as f: json.dump(current_config, f, indent=4)
+        with _config_write_lock(config_dir):
+            current_config = _jload(config_path)
+            current_config.update(new_settings)
+            _jdump(config_path, current_config)
+        reset_engines()
+        invalidate_views()
         return jsonify({"status": "success", "message": "Settings updated"})
     except Exception as e: return jsonify({"status": "error", "message": str(e)}), 500
+
+@audit_bp.route('/api/reload-engines', methods=['POST'])
+@login_required
+def reload_engines():
+    """Drops the cached AI/Fix engines so they are rebuilt from disk config on next use."""
+    reset_engines()
+    logger.info("AI/Fix engines reset")
+    return jsonify({"status": "success", "message": "Engines will reload on next request"})
@@ -0,0 +1,30 @@
+import orjson
+
+# Thin orjson wrapper shared by the web layer (routes, ProjectIndex, dashboard).
+# orjson parses/serializes in C and works on bytes, so files are always opened in binary mode.
+# NON_STR_KEYS: analyzer output keys slide maps by int slide number.
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+JSONDecodeError = orjson.JSONDecodeError  # a ValueError subclass
+
+
+def loads(data):
+    """Parses JSON from bytes or str."""
+    return orjson.loads(data)
+
+
+def dumps(obj, indent=False, sort_keys=False):
+    """Serializes to UTF-8 JSON bytes; `indent` gives the 2-space layout used for human-edited configs."""
+    option = _OPTIONS | (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return orjson.dumps(obj, option=option)
+
+
+def load(path):
+    """Reads and parses a JSON file."""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def dump(obj, path, indent=False):
+    """Writes a JSON file (not atomic - see routes._jdump for replace-on-write)."""
+    with open(path, 'wb') as f:
+        f.write(dumps(obj, indent=indent))
@@ -1,10 +1,26 @@
 import os
+import atexit
 import logging
+import queue
 import shutil
+import stat
 import time
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime
 
+
+class _StreamRouter(logging.Handler):
+    """Runs on the listener thread: hands each queued record to the file handler of its stream."""
+    def __init__(self):
+        super().__init__()
+        self.targets = {}
+
+    def emit(self, record):
+        target = self.targets.get(record.name)
+        if target is not None:
+            target.handle(record)
+
+
 class LoggerService:
     """
     A centralized logging service for the AuditSlide SaaS Platform.
@@ -18,17 +34,33 @@ class LoggerService:
        - Tracks: specific session logic, AI reasoning.
        - Retention: 7 Days (Managed by cleanup_user_logs on startup).
        - Privacy: Content inputs for Agent 1 & 3 are truncated.
+
+    Both streams are written asynchronously: loggers only enqueue records and a
+    single background QueueListener thread performs the file I/O, keeping
+    write/flush syscalls off the request path.
     """
-    def __init__(self, base_data_path='data'):
+    def __init__(self, base_data_path='data', run_cleanup=True):
         self.system_log_dir = os.path.join(base_data_path, 'logs')
         self.audit_log_base_dir = os.path.join(base_data_path, 'reports')
         os.makedirs(self.system_log_dir, exist_ok=True)
+
+        # Background writer shared by both streams (drained on interpreter exit)
+        self._log_queue = queue.SimpleQueue()
+        self._router = _StreamRouter()
+        self._listener = QueueListener(self._log_queue, self._router)
+        self._listener.start()
+        atexit.register(self.shutdown)
+        # Threads don't survive fork: preloaded gunicorn workers restart their own writer
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._restart_listener)
         
         # Initialize System Stream
         self.system_logger = self._setup_system_logger()
         
-        # Run Startup Cleanup Task (Enforce 7-day retention for user logs)
-        self.cleanup_user_logs(retention_days=7)
+        # Run Startup Cleanup Task (Enforce 7-day retention for user logs).
+        # The web app defers it to its one-time startup hook instead (run_cleanup=False).
+        if run_cleanup:
+            self.cleanup_user_logs(retention_days=7)
 
     def _setup_system_logger(self):
         """Initializes the Stream A system logger with 30-day rotation."""
@@ -45,10 +77,24 @@ class LoggerService:
         
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        self._router.targets[logger.name] = handler
+        logger.addHandler(QueueHandler(self._log_queue))
 
         return logger
 
+    def _restart_listener(self):
+        """Starts a fresh background writer in a forked child (the parent's thread is gone)."""
+        if self._listener is not None:
+            self._listener = QueueListener(self._log_queue, self._router)
+            self._listener.start()
+
+    def shutdown(self):
+        """Drains queued records and stops the background writer. Safe to call more than once."""
+        atexit.unregister(self.shutdown)
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
     def _get_audit_logger(self, report_id):
         """Initializes Stream B logger for a specific session."""
         report_log_dir = os.path.join(self.audit_log_base_dir, str(report_id), 'logs')
@@ -63,7 +109,8 @@ class LoggerService:
             handler = logging.FileHandler(log_file, mode='a')
             formatter = logging.Formatter('%(asctime)s - %(levelname)s - AGENT: %(agent)s - %(message)s')
             handler.setFormatter(formatter)
-            logger.addHandler(handler)
+            self._router.targets[logger_name] = handler
+            logger.addHandler(QueueHandler(self._log_queue))
         
         return logger
 
@@ -96,14 +143,18 @@ class LoggerService:
             return
 
         try:
-            for report_id in os.listdir(self.audit_log_base_dir):
-                report_path = os.path.join(self.audit_log_base_dir, report_id)
-                log_dir = os.path.join(report_path, 'logs')
-                
-                # Check if the 'logs' folder exists and is older than retention period
-                if os.path.exists(log_dir) and os.path.isdir(log_dir):
-                    dir_mtime = os.path.getmtime(log_dir)
-                    if dir_mtime < cutoff:
+            with os.scandir(self.audit_log_base_dir) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    log_dir = os.path.join(entry.path, 'logs')
+
+                    # Check if the 'logs' folder exists and is older than retention period (single stat)
+                    try:
+                        log_st = os.stat(log_dir)
+                    except FileNotFoundError:
+                        continue
+                    if stat.S_ISDIR(log_st.st_mode) and log_st.st_mtime < cutoff:
                         shutil.rmtree(log_dir) # Delete only the logs folder
                         deleted_count += 1
                         
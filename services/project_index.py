@@ -0,0 +1,322 @@
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+from services import fastjson
+
+# Optional: stream just the 'summary' block out of a report instead of parsing all of it
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Cross-process lock for manifest updates (POSIX; without it only threads are serialized)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+@dataclass(frozen=True, slots=True)
+class ReportSummary:
+    """One manifest entry, as listed on the dashboards."""
+    id: str
+    project_name: str
+    filename: str
+    date: str
+    score: float
+    issues: int
+    source_path: str = None
+
+    @classmethod
+    def from_entry(cls, report_id, entry):
+        return cls(
+            id=report_id,
+            project_name=entry.get('project_name'),
+            filename=entry.get('filename'),
+            date=entry.get('date'),
+            score=entry.get('score') or 0,
+            issues=entry.get('issues') or 0,
+            source_path=entry.get('source_path')
+        )
+
+
+class ProjectIndex:
+    """
+    A lightweight manifest of audit reports for the AuditSlide SaaS Platform.
+    Stores only the summary fields the dashboards need, keyed by report_id:
+
+        /data/reports/_index.json
+        { report_id: {project_name, filename, date, score, issues, mtime, source_path} }
+
+    Write paths (upload, re-analysis, delete) keep it current via upsert()/drop(),
+    so read paths get every report summary from a single file read instead of
+    opening and parsing each audit_report.json.
+    """
+    INDEX_FILENAME = '_index.json'
+    LOCK_FILENAME = '_index.lock'
+    REPORT_FILENAME = 'audit_report.json'
+    SUMMARY_FILENAME = 'summary.json'
+    # Concurrent stat/open/read during a rebuild (file reads release the GIL)
+    SCAN_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+    def __init__(self, base_data_path='data'):
+        self.reports_dir = os.path.join(base_data_path, 'reports')
+        self.index_path = os.path.join(self.reports_dir, self.INDEX_FILENAME)
+        self.lock_path = os.path.join(self.reports_dir, self.LOCK_FILENAME)
+        self._lock = threading.Lock()
+        # Parsed summaries from earlier scans: {json_path: ((mtime_ns, size), summary_subset)}
+        self._summary_cache = {}
+        # Last listing of the reports folder, reused while the folder's own mtime is unchanged
+        self._dir_listing = (None, [])
+        # Parsed manifest, keyed by the (mtime_ns, size, inode) of _index.json when it was read/written
+        self._manifest = (None, {})
+        # ReportSummary list and dashboard stats, each with the manifest object it was derived from
+        self._reports = (None, [])
+        self._stats = (None, (0, 0))
+        os.makedirs(self.reports_dir, exist_ok=True)
+
+    @staticmethod
+    def summary_subset(summary, mtime=0):
+        """Extracts the fields listed on the dashboards from a report 'summary' block."""
+        return {
+            'project_name': summary.get('project_name'),
+            'filename': summary.get('presentation_name'),
+            'date': summary.get('date_generated'),
+            'score': summary.get('executive_metrics', {}).get('wcag_compliance_rate', 0),
+            'issues': summary.get('total_errors', 0),
+            'mtime': mtime,
+            'source_path': summary.get('source_path')
+        }
+
+    def _report_path(self, report_id):
+        return os.path.join(self.reports_dir, str(report_id), self.REPORT_FILENAME)
+
+    @contextmanager
+    def _locked(self):
+        """
+        Serializes manifest read-modify-writes across threads and gunicorn workers:
+        the thread lock, then an exclusive flock on _index.lock (released when the file closes).
+        """
+        with self._lock, open(self.lock_path, 'ab') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            yield
+
+    @staticmethod
+    def _stat_key(st):
+        # The inode as well: each write replaces the file, so a same-size rewrite on a coarse clock still misses
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _read(self):
+        """Returns the parsed manifest, re-reading _index.json only when it changed on disk (e.g. another worker wrote it)."""
+        st = os.stat(self.index_path)
+        key = self._stat_key(st)
+        if self._manifest[0] == key:
+            return self._manifest[1]
+
+        entries = fastjson.load(self.index_path)
+        self._manifest = (key, entries)
+        return entries
+
+    def _write(self, entries):
+        """Replaces _index.json atomically: readers in other workers never see a partial file."""
+        tmp_path = f"{self.index_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+        try:
+            fastjson.dump(entries, tmp_path)
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._manifest = (self._stat_key(os.stat(self.index_path)), entries)
+
+    def _read_summary(self, report_dir, json_path, report_mtime_ns):
+        """
+        Returns a report's 'summary' block from its summary.json sidecar when that is
+        at least as new as audit_report.json; otherwise parses the full report once
+        and writes the sidecar for next time.
+        """
+        summary_path = f"{report_dir}{os.sep}{self.SUMMARY_FILENAME}"
+        try:
+            if os.stat(summary_path).st_mtime_ns >= report_mtime_ns:
+                return fastjson.load(summary_path)
+        except (OSError, ValueError):
+            pass
+
+        summary = self._parse_report_summary(json_path)
+        try:
+            fastjson.dump(summary, summary_path)
+        except OSError:
+            pass
+        return summary
+
+    @staticmethod
+    def _parse_report_summary(json_path):
+        """
+        The 'summary' block of a full audit_report.json. qa_tool writes it as the first key,
+        so with ijson parsing stops after it instead of building the whole (multi-MB) report.
+        """
+        with open(json_path, 'rb') as f:
+            if IJSON_AVAILABLE:
+                return next(ijson.items(f, 'summary', use_float=True), {})
+            return fastjson.loads(f.read()).get('summary', {})
+
+    def _list_report_dirs(self):
+        """
+        Returns [(report_id, path)] for each report folder. DirEntry type info avoids a stat
+        per entry, and the listing is reused until a folder is added or removed (root mtime).
+        """
+        root_mtime_ns = os.stat(self.reports_dir).st_mtime_ns
+        if self._dir_listing[0] == root_mtime_ns:
+            return self._dir_listing[1]
+
+        with os.scandir(self.reports_dir) as it:
+            # Dot folders (.trash of deleted reports) are never reports
+            report_dirs = [(entry.name, entry.path) for entry in it
+                           if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.')]
+        self._dir_listing = (root_mtime_ns, report_dirs)
+        return report_dirs
+
+    def _scan(self):
+        """
+        Full scan of the reports folder. Only used when the manifest is missing or rebuilt.
+        Reports unchanged since the previous scan (same mtime_ns and size) cost one stat, not a parse.
+        """
+        report_dirs = self._list_report_dirs()
+        entries = {}
+        seen = {}
+        if not report_dirs:
+            self._summary_cache = seen
+            return entries
+        # Overlap the per-report I/O; results come back in directory order. The pool lives for
+        # one scan only: a kept pool made in the gunicorn master (preload) has no threads after fork.
+        with ThreadPoolExecutor(max_workers=min(self.SCAN_WORKERS, len(report_dirs)), thread_name_prefix='index-scan') as pool:
+            results = pool.map(self._load_entry, (report_dir for _, report_dir in report_dirs))
+            for (report_id, _), result in zip(report_dirs, results):
+                if result is None:
+                    continue
+                json_path, stat_key, entry = result
+                seen[json_path] = (stat_key, entry)
+                entries[report_id] = dict(entry)
+        # Only reports still on disk stay cached
+        self._summary_cache = seen
+        return entries
+
+    def _load_entry(self, report_dir):
+        """Returns (json_path, (mtime_ns, size), summary_subset) for one report folder, or None if it has no report."""
+        # Per-folder hot path: plain concatenation (report_dir comes from scandir, no trailing sep)
+        json_path = f"{report_dir}{os.sep}{self.REPORT_FILENAME}"
+        # A missing audit_report.json (e.g. remediated_decks/) raises here - one syscall, no pre-check
+        try:
+            st = os.stat(json_path)
+            # Size as well as mtime: a same-timestamp rewrite (coarse fs clocks) still misses
+            stat_key = (st.st_mtime_ns, st.st_size)
+            cached = self._summary_cache.get(json_path)
+            if cached and cached[0] == stat_key:
+                return json_path, stat_key, cached[1]
+            summary = self._read_summary(report_dir, json_path, st.st_mtime_ns)
+            return json_path, stat_key, self.summary_subset(summary, st.st_mtime)
+        except Exception:
+            return None
+
+    def load(self):
+        """
+        Returns {report_id: summary_subset} (shared - treat as read-only).
+        Lazily rebuilds the manifest on first use; afterwards costs one stat while unchanged.
+        """
+        with self._lock:
+            try:
+                return self._read()
+            except (FileNotFoundError, ValueError):
+                pass
+        # Missing or unreadable: rebuild it, unless another worker did while we waited for the lock
+        with self._locked():
+            try:
+                return self._read()
+            except (FileNotFoundError, ValueError):
+                entries = self._scan()
+                self._write(entries)
+                return entries
+
+    def warm(self):
+        """Loads (or builds) the manifest ahead of the first request. Never fatal."""
+        try:
+            self.load()
+        except OSError:
+            pass
+
+    def reports(self):
+        """
+        Every known report as a ReportSummary - the one place listings read from.
+        Built once per manifest change and shared (read-only) until the next one.
+        """
+        entries = self.load()
+        built_from, reports = self._reports
+        if built_from is not entries:
+            reports = [ReportSummary.from_entry(report_id, entry) for report_id, entry in entries.items()]
+            self._reports = (entries, reports)
+        return reports
+
+    def rebuild(self):
+        """Discards the manifest and rebuilds it from the reports on disk."""
+        with self._locked():
+            entries = self._scan()
+            self._write(entries)
+            return entries
+
+    def upsert(self, report_id, summary, source_path=None):
+        """Records (or refreshes) the summary of a single report and, optionally, its uploaded deck path."""
+        try:
+            mtime = os.path.getmtime(self._report_path(report_id))
+        except OSError:
+            mtime = 0
+
+        with self._locked():
+            try:
+                entries = dict(self._read())
+            except (FileNotFoundError, ValueError):
+                entries = self._scan()
+            entry = self.summary_subset(summary, mtime)
+            entry['source_path'] = source_path or entry['source_path'] or entries.get(str(report_id), {}).get('source_path')
+            entries[str(report_id)] = entry
+            self._write(entries)
+
+    def score_stats(self):
+        """(total_reports, average compliance score rounded to 0.1) - recomputed only when the manifest changes."""
+        reports = self.reports()
+        built_from, stats = self._stats
+        if built_from is not reports:
+            scores = [r.score for r in reports]
+            stats = (len(scores), round(sum(scores) / len(scores), 1) if scores else 0)
+            self._stats = (reports, stats)
+        return stats
+
+    def find_source(self, filename=None, report_id=None):
+        """Returns the recorded upload path of a deck, by report_id or by file name. None if unknown."""
+        if report_id:
+            return self.load().get(str(report_id), {}).get('source_path')
+
+        for report in self.reports():
+            source_path = report.source_path
+            if source_path and filename in (report.filename, os.path.basename(source_path)):
+                return source_path
+        return None
+
+    def drop(self, *report_ids):
+        """Removes deleted reports from the manifest."""
+        with self._locked():
+            try:
+                entries = dict(self._read())
+            except (FileNotFoundError, ValueError):
+                return
+            for report_id in report_ids:
+                entries.pop(str(report_id), None)
+                # Don't keep parsed summaries of deleted reports around until the next full scan
+                self._summary_cache.pop(self._report_path(report_id), None)
+            self._write(entries)
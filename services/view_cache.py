@@ -0,0 +1,45 @@
+import os
+import secrets
+
+from flask import request, session
+from flask_caching import Cache
+from flask_login import current_user
+
+# Short-lived cache for the read-only dashboard views (index, projects, settings).
+# Bound to the app in app.py via cache.init_app(app, config=VIEW_CACHE_CONFIG).
+# File-backed under data/, so every gunicorn worker shares the entries and the invalidations.
+VIEW_CACHE_CONFIG = {
+    'CACHE_TYPE': 'FileSystemCache',
+    'CACHE_DIR': os.path.join('data', '.view_cache'),
+    'CACHE_DEFAULT_TIMEOUT': 5,
+    'CACHE_THRESHOLD': 1000
+}
+VIEW_CACHE_TIMEOUT = 5
+
+# Generation of all cached pages: bumping it orphans every entry at once (they expire on their own)
+VERSION_KEY = 'view/version'
+
+cache = Cache()
+
+
+def view_key(path, user_id):
+    """Cache key of one user's rendering of a page in the current generation: 'view/<version>/<user_id><path>'."""
+    return f"view/{cache.get(VERSION_KEY) or 0}/{user_id}{path}"
+
+
+def current_view_key():
+    """key_prefix for @cache.cached: pages list per-user projects, so keys include the user."""
+    return view_key(request.path, current_user.get_id())
+
+
+def has_pending_flashes():
+    """unless= for @cache.cached: a page with flash messages waiting is rendered fresh and not stored."""
+    return bool(session.get('_flashes'))
+
+
+def invalidate_views():
+    """
+    Drops every cached page, for all users and workers. Dashboards aggregate global data
+    (KPIs, the report manifest), so any project or settings mutation calls this.
+    """
+    cache.set(VERSION_KEY, secrets.token_hex(4), timeout=0)
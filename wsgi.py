@@ -0,0 +1,8 @@
+# /wsgi.py - PRODUCTION ENTRY POINT
+# Usage: gunicorn -c gunicorn.conf.py wsgi:app
+
+from app import app, run_startup_tasks
+
+if __name__ == '__main__':
+    run_startup_tasks()
+    app.run()